@@ -10,20 +10,39 @@ import os
 import re
 import time
 import json
+import io
+import math
+import mmap
 import gc
 import base64
+import binascii
 import mimetypes
 import threading
+import functools
+import itertools
+import traceback
 import multiprocessing as mp
 from datetime import datetime
 from pathlib import Path
-from collections import defaultdict
-from urllib.parse import urljoin, urlparse, urldefrag
-from queue import Queue
+from collections import defaultdict, deque
+from urllib.parse import urljoin, urlparse, urlsplit, urldefrag
+from queue import Queue, Empty
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer, NavigableString, Tag
+from bs4.dammit import EncodingDetector
 from pypdf import PdfWriter, PdfReader
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:  # bs4 paths below still work, just slower
+    lxml = etree = None
+try:
+    import orjson
+except ImportError:  # stdlib json does the same job
+    orjson = None
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
@@ -52,10 +71,42 @@ VIDEO_EXTS = {'.mp4','.webm','.mov','.avi','.mkv','.ogv','.flv','.m4v'}
 AUDIO_EXTS = {'.mp3','.ogg','.wav','.aac','.flac','.m4a','.opus'}
 MEDIA_EXTS = IMAGE_EXTS | VIDEO_EXTS | AUDIO_EXTS
 
+mimetypes.add_type("image/webp", ".webp")
+mimetypes.add_type("image/x-icon", ".ico")
+mimetypes.add_type("audio/mpeg", ".mp3")
+# guess_type re-splits the name on every call; media extensions are resolved up front
+_EXT_MIME = {ext: mimetypes.guess_type('file' + ext)[0] for ext in MEDIA_EXTS}
+
+# Hot-path patterns, compiled once
+_RE_SAFE_FN      = re.compile(r'[<>:"/\\|?*\n\r\t]')
+_RE_THREAD_ID    = re.compile(r'(?:showthread\.php.*[?&]t=|/threads/[^/]*\.|viewtopic\.php.*[?&]t=)(\d+)')
+_RE_SECTION_PAGE = re.compile(r'(?:[?&]page=|/page-)(\d+)')
+_RE_PAGE_NUM     = re.compile(r'(?:[?&/](?:page|p)[=-]?)(\d+)')
+_RE_PAGE_PARAM   = re.compile(r'([?&/](?:page|p)[=-]?\d+)')
+_RE_PAGE_DASH    = re.compile(r'/page-\d+')
+_RE_CHARSET      = re.compile(r'charset=["\']?([\w.:-]+)', re.I)
+
+# One C-level pass instead of chained .replace() calls
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})
+
+# Fetch workers spend nearly all their time blocked on sockets, so the pools scale well past core count
+MAX_WORKERS_CAP = 64
+
+# Log lines are flushed to the Text widgets in batches, ~60 times a second
+LOG_FLUSH_MS  = 16
+LOG_FLUSH_MAX = 500
+# Trailing-edge debounce for <Configure> bursts while the window is being dragged
+RESIZE_DEBOUNCE_MS = 40
+# Progress bars repaint at most ~30 times a second however fast workers report
+PROGRESS_FLUSH_MS = 33
+# Header rune animation frame cap
+RUNE_MAX_FPS = 18
+
 # ─────────────────────────────────────────────
 #  HELPERS
 # ─────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=8192)
 def clean_text(text):
     return ' '.join(text.strip().replace('\r','').replace('\xa0',' ').split())
 def parse_date(text):
@@ -78,14 +129,32 @@ def parse_date(text):
             pass
     return None
 def safe_filename(name, maxlen=80):
-    return re.sub(r'[<>:"/\\|?*\n\r\t]', '_', name)[:maxlen]
+    return _RE_SAFE_FN.sub('_', name)[:maxlen]
+@functools.lru_cache(maxsize=65536)
+def _split(url):
+    # the same media URLs get split again by the downloader, converter and renderer
+    return urlsplit(url)
+@functools.lru_cache(maxsize=65536)
 def get_ext(url):
-    path = urlparse(url).path
+    path = _split(url).path
     _, ext = os.path.splitext(path)
     return ext.lower()
+def _is_media_url(url):
+    # string-only twin of `get_ext(url) in MEDIA_EXTS` for absolute http(s) URLs
+    if not url[:8].lower().startswith(('http://', 'https://')): return False
+    if ';' in url: return get_ext(url) in MEDIA_EXTS
+    end = len(url)
+    for sep in '?#':
+        i = url.find(sep, 0, end)
+        if i != -1: end = i
+    root = url.find('/', url.index('//') + 2, end)
+    if root == -1: return False
+    slash = url.rfind('/', root, end)
+    dot   = url.rfind('.', slash, end)
+    return dot > slash + 1 and url[dot:end].lower() in MEDIA_EXTS
 def guess_mime(url, data=None):
     ext = get_ext(url)
-    mime = mimetypes.guess_type('file' + ext)[0]
+    mime = _EXT_MIME[ext] if ext in _EXT_MIME else mimetypes.guess_type('file' + ext)[0]
     if mime:
         return mime
     if data and len(data) >= 4:
@@ -98,94 +167,200 @@ def guess_mime(url, data=None):
 def data_uri(data_bytes, mime):
     b64 = base64.b64encode(data_bytes).decode('ascii')
     return f"data:{mime};base64,{b64}"
+def make_session(pool_size=10, user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'):
+    # one keep-alive pool per engine, shared by its worker threads
+    session = requests.Session()
+    session.headers.update({'User-Agent': user_agent})
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size * 2,
+                          max_retries=Retry(total=3, backoff_factor=0.3))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+def decode_html(response):
+    # header charset, then <meta charset>, then strict utf-8; charset sniffing only as a last resort
+    raw = response.content
+    m   = _RE_CHARSET.search(response.headers.get('Content-Type', ''))
+    for enc in (m.group(1) if m else None,
+                EncodingDetector.find_declared_encoding(raw, is_html=True),
+                'utf-8'):
+        if not enc: continue
+        try:
+            return raw.decode(enc)
+        except (LookupError, UnicodeDecodeError):
+            pass
+    return raw.decode(response.apparent_encoding or 'utf-8', errors='replace')
+def make_soup(markup, **kwargs):
+    # libxml2 does the heavy lifting; html.parser only as a last resort for pages lxml chokes on.
+    # huge_tree keeps multi-MB base64 attributes that libxml2 would otherwise silently drop
+    try:
+        return BeautifulSoup(markup, 'lxml', huge_tree=True, **kwargs)
+    except Exception:
+        return BeautifulSoup(markup, 'html.parser', **kwargs)
+
+class HostRateLimiter:
+    """Per-host request spacing shared by every worker thread of an engine."""
+    def __init__(self, interval, stop_event=None):
+        self.interval = max(0.0, interval)
+        self._stop    = stop_event or threading.Event()
+        self._lock    = threading.Lock()
+        self._next    = {}
+    def acquire(self, url):
+        if not self.interval: return
+        host = _split(url).netloc
+        with self._lock:
+            now  = time.monotonic()
+            slot = max(now, self._next.get(host, now))
+            self._next[host] = slot + self.interval
+        # sleep outside the lock so other hosts are not held up
+        if slot > now:
+            self._stop.wait(slot - now)
+
+# Media up to this size is read in one go; larger bodies are copied in blocks of this size
+_SMALL_MEDIA = 1 << 20
+
+# Only these tags can carry downloadable media; everything else is skipped at parse time
+_MEDIA_TAGS     = ['img','video','audio','source','a']
+_MEDIA_STRAINER = SoupStrainer(_MEDIA_TAGS)
+# Listing and pagination scans only ever look at links
+_THREAD_HREF    = re.compile(r'showthread\.php|/threads/|viewtopic\.php')
+_PAGE_HREF      = re.compile(r'page')
+_THREAD_LINKS   = SoupStrainer('a', href=_THREAD_HREF)
+_PAGE_LINKS     = SoupStrainer('a', href=_PAGE_HREF)
+# huge_tree: archives carry base64 media far beyond libxml2's default 10 MB node limit
+_LXML_PARSER = lxml.html.HTMLParser(huge_tree=True) if etree else None
+_XP_THREAD_LINKS = etree.XPath("//a[contains(@href,'showthread.php') or contains(@href,'/threads/')"
+                               " or contains(@href,'viewtopic.php')]") if etree else None
 
 # ─────────────────────────────────────────────
 #  MEDIA DOWNLOADER
 # ─────────────────────────────────────────────
 
 class MediaDownloader:
-    def __init__(self, output_dir, delay=0.3, log_callback=None, stop_event=None):
+    def __init__(self, output_dir, delay=0.3, log_callback=None, stop_event=None, pool_size=10):
         self.media_dir   = os.path.join(output_dir, 'media')
         self.delay       = delay
         self.log         = log_callback or print
         self._stop       = stop_event or threading.Event()
+        self._session    = make_session(pool_size, 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)')
+        # same aggregate ceiling as pool_size workers each pausing `delay`, spread evenly per host
+        self._limiter    = HostRateLimiter(delay / max(1, pool_size), self._stop)
         self._index_file = os.path.join(self.media_dir, '_media_index.json')
+        self._journal    = os.path.join(self.media_dir, '_media_index.jsonl')
+        self._journal_fp = None
         os.makedirs(self.media_dir, exist_ok=True)
         self._index = self._load_index()
+        # names already on disk, listed once; new names are reserved here instead of stat-probing
+        self._lock  = threading.Lock()
+        self._names = {e.name for e in os.scandir(self.media_dir)}
     def _load_index(self):
+        # snapshot first, then replay entries journaled since the last compaction
+        index = {}
         if os.path.exists(self._index_file):
             try:
                 with open(self._index_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                    index = json.load(f)
             except:
                 pass
-        return {}
-    def _save_index(self):
-        try:
-            with open(self._index_file, 'w', encoding='utf-8') as f:
-                json.dump(self._index, f, indent=2, ensure_ascii=False)
-        except:
-            pass
-    def _fetch_bytes(self, url):
+        if os.path.exists(self._journal):
+            with open(self._journal, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try: index.update(json.loads(line))
+                    except ValueError: pass
+        return index
+    def _record(self, url, fname):
+        self._index[url] = fname
+        line = json.dumps({url: fname}, ensure_ascii=False) + '\n'
+        with self._lock:
+            try:
+                if self._journal_fp is None:
+                    self._journal_fp = open(self._journal, 'a', encoding='utf-8')
+                self._journal_fp.write(line)
+                self._journal_fp.flush()
+            except OSError:
+                pass
+    def compact_index(self):
+        # fold the journal back into the JSON snapshot; called once when a backup finishes
+        with self._lock:
+            try:
+                with open(self._index_file, 'w', encoding='utf-8') as f:
+                    json.dump(self._index, f, indent=2, ensure_ascii=False)
+                if self._journal_fp is not None:
+                    self._journal_fp.close(); self._journal_fp = None
+                if os.path.exists(self._journal):
+                    os.remove(self._journal)
+            except:
+                pass
+    def _fetch_to_file(self, url, fpath):
+        # stream straight to disk so large attachments never sit in RAM; partial files are removed
+        done = False
         try:
-            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'}
-            r = requests.get(url, headers=headers, timeout=20, stream=True)
-            r.raise_for_status()
-            chunks = []
-            for chunk in r.iter_content(65536):
-                if self._stop.is_set():
-                    return None
-                chunks.append(chunk)
-            return b''.join(chunks)
+            self._limiter.acquire(url)
+            with self._session.get(url, timeout=20, stream=True) as r:
+                r.raise_for_status()
+                length = int(r.headers.get('Content-Length') or 0)
+                with open(fpath, 'wb') as f:
+                    if 0 < length <= _SMALL_MEDIA:
+                        # icons and thumbnails: one read, no per-chunk loop
+                        f.write(r.content)
+                        done = True
+                    else:
+                        r.raw.decode_content = True
+                        while not self._stop.is_set():
+                            block = r.raw.read(_SMALL_MEDIA)
+                            if not block:
+                                done = True
+                                break
+                            f.write(block)
         except Exception as e:
-            self.log(f"    ⚠ Media skip ({os.path.basename(urlparse(url).path)}): {e}")
-            return None
-    def download_from_html(self, html_content, page_base_url):
-        soup = BeautifulSoup(html_content, 'html.parser')
-        urls = set()
-        for tag in soup.find_all('img', src=True):
-            urls.add(urljoin(page_base_url, tag['src']))
-        for tag in soup.find_all(['video','audio'], src=True):
-            urls.add(urljoin(page_base_url, tag['src']))
-        for tag in soup.find_all('source', src=True):
-            urls.add(urljoin(page_base_url, tag['src']))
-        for tag in soup.find_all('a', href=True):
-            href = urljoin(page_base_url, tag['href'])
-            if get_ext(href) in MEDIA_EXTS:
-                urls.add(href)
-        for tag in soup.find_all(attrs={'data-src': True}):
-            urls.add(urljoin(page_base_url, tag['data-src']))
-        soup.decompose()
-        media_urls = [u for u in urls if get_ext(u) in MEDIA_EXTS and urlparse(u).scheme in ('http','https')]
+            self.log(f"    ⚠ Media skip ({os.path.basename(_split(url).path)}): {e}")
+        if not done:
+            try: os.remove(fpath)
+            except OSError: pass
+        return done
+    def _reserve_name(self, fname):
+        base, e = os.path.splitext(fname)
+        cand, counter = fname, 1
+        with self._lock:
+            while cand in self._names:
+                cand = f"{base}_{counter}{e}"
+                counter += 1
+            self._names.add(cand)
+        return cand
+    def collect_media_urls(self, html_content, page_base_url):
+        # callers that already parsed the page hand us the soup; only decompose trees we built
+        owned = isinstance(html_content, (str, bytes))
+        soup  = make_soup(html_content, parse_only=_MEDIA_STRAINER) if owned else html_content
+        media_urls, seen = [], set()
+        for tag in soup.find_all(_MEDIA_TAGS):
+            cands = (tag.get('href'),) if tag.name == 'a' else (tag.get('src'), tag.get('data-src'))
+            for raw in cands:
+                if not raw: continue
+                url = urljoin(page_base_url, raw)
+                if url in seen: continue
+                seen.add(url)
+                if _is_media_url(url):
+                    media_urls.append(url)
+        if owned: soup.decompose()
+        return media_urls
+    def download_urls(self, media_urls):
         downloaded = 0
         for url in media_urls:
             if self._stop.is_set():
                 break
             if url in self._index:
                 continue
-            data = self._fetch_bytes(url)
-            if data is None:
-                continue
             ext  = get_ext(url) or '.bin'
-            fname = safe_filename(os.path.basename(urlparse(url).path) or 'media', 120)
+            fname = safe_filename(os.path.basename(_split(url).path) or 'media', 120)
             if not fname.lower().endswith(ext):
                 fname += ext
+            fname = self._reserve_name(fname)
             fpath = os.path.join(self.media_dir, fname)
-            counter = 1
-            while os.path.exists(fpath):
-                base, e = os.path.splitext(fname)
-                fpath = os.path.join(self.media_dir, f"{base}_{counter}{e}")
-                counter += 1
-            try:
-                with open(fpath, 'wb') as f:
-                    f.write(data)
-                self._index[url] = os.path.basename(fpath)
-                downloaded += 1
-                self.log(f"    📥 Media: {os.path.basename(fpath)}")
-                time.sleep(self.delay)
-            except Exception as e:
-                self.log(f"    ⚠ Could not save media: {e}")
-        self._save_index()
+            if not self._fetch_to_file(url, fpath):
+                with self._lock: self._names.discard(fname)
+                continue
+            self._record(url, fname)
+            downloaded += 1
+            self.log(f"    📥 Media: {os.path.basename(fpath)}")
         return downloaded
     def get_local_path(self, url):
         fname = self._index.get(url)
@@ -194,40 +369,52 @@ class MediaDownloader:
         return None
     def get_base64_uri(self, url):
         path = self.get_local_path(url)
-        if path and os.path.exists(path):
+        if path:
             try:
-                with open(path, 'rb') as f:
-                    data = f.read()
-                mime = guess_mime(url, data)
-                return data_uri(data, mime)
+                # avatars and smilies repeat across every post; keep small encodings around
+                if os.path.getsize(path) <= _DATA_URI_CACHE_MAX:
+                    return _cached_data_uri(path, get_ext(url))
+                return _read_data_uri(path, get_ext(url))
             except:
                 pass
         return None
 
+# 64 KiB covers avatars and smilies; 256 entries then pin at most ~22 MB of base64
+_DATA_URI_CACHE_MAX = 64 << 10
+def _read_data_uri(path, ext):
+    with open(path, 'rb') as f:
+        data = f.read()
+    return data_uri(data, guess_mime('file' + ext, data))
+_cached_data_uri = functools.lru_cache(maxsize=256)(_read_data_uri)
+
 # ─────────────────────────────────────────────
 #  BACKUP LOGIC (original, unchanged)
 # ─────────────────────────────────────────────
 
 class VBulletinBackup:
     def __init__(self, base_url, output_dir="backup", delay=1.0, max_workers=10,
-                 start_page=1, log_callback=None, download_media=False, stop_event=None):
+                 start_page=1, log_callback=None, download_media=False, stop_event=None,
+                 rescan_media=False):
         self.base_url       = base_url.rstrip('/')
         self.output_dir     = output_dir
         self.delay          = delay
-        self.max_workers    = max_workers
+        self.max_workers    = max(1, min(int(max_workers), MAX_WORKERS_CAP))
         self.start_page     = start_page
         self.log            = log_callback or print
         self.download_media = download_media
+        self.rescan_media   = rescan_media
         os.makedirs(output_dir, exist_ok=True)
         self.metadata_file  = os.path.join(output_dir, 'backup_metadata.json')
         self.metadata       = self.load_metadata()
         self._stop_event    = stop_event or threading.Event()
+        self._session       = make_session(self.max_workers)
+        self._limiter       = HostRateLimiter(delay / self.max_workers, self._stop_event)
         self._media_dl      = MediaDownloader(output_dir, delay=delay*0.5,
                                               log_callback=log_callback,
-                                              stop_event=self._stop_event) if download_media else None
-        self.force_gc()
+                                              stop_event=self._stop_event,
+                                              pool_size=self.max_workers) if download_media else None
     def force_gc(self):
-        for _ in range(3): gc.collect()
+        gc.collect()
     def load_metadata(self):
         if os.path.exists(self.metadata_file):
             try:
@@ -239,104 +426,107 @@ class VBulletinBackup:
         self.metadata['last_backup'] = datetime.now().isoformat()
         with open(self.metadata_file,'w',encoding='utf-8') as f:
             json.dump(self.metadata, f, indent=2, ensure_ascii=False)
-        self.force_gc()
     def get_page(self, url):
-        session = response = None
+        response = None
         try:
-            session = requests.Session()
-            session.headers.update({'User-Agent':'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'})
-            response = session.get(url, timeout=30, stream=True)
+            self._limiter.acquire(url)
+            response = self._session.get(url, timeout=30)
             response.raise_for_status()
-            content = ""
-            for chunk in response.iter_content(chunk_size=8192, decode_unicode=True):
-                if chunk: content += chunk
-            return content
+            return decode_html(response)
         except Exception as e:
             self.log(f"  ⚠ Error downloading {url}: {e}")
             return None
         finally:
-            if response: response.close(); del response
-            if session:  session.close();  del session
-            self.force_gc()
-    def extract_thread_links(self, html_content, base_url):
-        thread_links = []
-        soup = None
+            if response: response.close()
+    def _iter_thread_anchors(self, html_content):
+        # (href, text) for every thread link; one precompiled XPath pass when lxml is present
+        if _XP_THREAD_LINKS is not None:
+            try:
+                try:
+                    tree = lxml.html.fromstring(html_content, parser=_LXML_PARSER)
+                except ValueError:  # str with an XML encoding declaration
+                    tree = lxml.html.fromstring(html_content.encode('utf-8'), parser=_LXML_PARSER)
+            except Exception:
+                tree = None
+            if tree is not None:
+                for link in _XP_THREAD_LINKS(tree):
+                    yield link.get('href'), ''.join(t.strip() for t in link.itertext())
+                return
+        soup = make_soup(html_content, parse_only=_THREAD_LINKS)
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            for pattern in ['a[href*="showthread.php"]','a[href*="/threads/"]','a[href*="viewtopic.php"]']:
-                for link in soup.select(pattern):
-                    href = link.get('href')
-                    if href:
-                        full_url  = urljoin(base_url, href)
-                        thread_id = self.extract_thread_id(full_url)
-                        if thread_id:
-                            thread_links.append({'id':thread_id,'url':full_url,'title':link.get_text(strip=True)})
+            for link in soup.find_all('a', href=_THREAD_HREF):
+                yield link['href'], link.get_text(strip=True)
         finally:
-            if soup: soup.decompose(); del soup
-            del html_content
-            self.force_gc()
+            soup.decompose()
+    def extract_thread_links(self, html_content, base_url):
+        thread_links = []
+        for href, title in self._iter_thread_anchors(html_content):
+            full_url  = urljoin(base_url, href)
+            thread_id = self.extract_thread_id(full_url)
+            if thread_id:
+                thread_links.append({'id':thread_id,'url':full_url,'title':title})
         seen, unique = set(), []
         for t in thread_links:
             if t['id'] not in seen:
                 seen.add(t['id']); unique.append(t)
         return unique
     def extract_thread_id(self, url):
-        for p in [r'showthread\.php.*[?&]t=(\d+)',r'/threads/[^/]*\.(\d+)',r'viewtopic\.php.*[?&]t=(\d+)']:
-            m = re.search(p, url)
-            if m: return m.group(1)
-        return None
-    def get_all_pages_urls(self, section_url):
+        m = _RE_THREAD_ID.search(url)
+        return m.group(1) if m else None
+    def get_all_pages_urls(self, section_url, html_content=None):
         pages = [section_url]
-        html_content = soup = None
+        soup = None
         try:
-            html_content = self.get_page(section_url)
+            if html_content is None:
+                html_content = self.get_page(section_url)
             if not html_content: return pages
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = make_soup(html_content)
             page_numbers = set()
             for link in soup.find_all("a", href=True):
-                m = re.search(r'(?:[?&]page=|/page-)(\d+)', link["href"])
+                m = _RE_SECTION_PAGE.search(link["href"])
                 if m: page_numbers.add(int(m.group(1)))
             if page_numbers:
+                dash_base = _RE_PAGE_DASH.sub('', section_url.rstrip('/'))
                 for page_num in range(self.start_page, max(page_numbers)+1):
                     if page_num == 1:
                         pages.append(section_url)
                     elif "/page-" in section_url:
-                        pages.append(re.sub(r'/page-\d+','',section_url.rstrip('/'))+f"/page-{page_num}")
+                        pages.append(dash_base+f"/page-{page_num}")
                     elif '?' in section_url:
                         pages.append(f"{section_url}&page={page_num}")
                     else:
                         pages.append(f"{section_url}?page={page_num}")
         finally:
-            if soup: soup.decompose(); del soup
-            if html_content: del html_content
-            self.force_gc()
+            if soup: soup.decompose()
         return pages
     def discover_all_threads(self):
         self.log(f"🔮 Scanning section: {self.base_url}")
         all_threads = []
-        pages = self.get_all_pages_urls(self.base_url)
+        # the first section page is fetched once and reused; page 1 used to be requested three times
+        first_html = self.get_page(self.base_url)
+        pages = list(dict.fromkeys(self.get_all_pages_urls(self.base_url, first_html or '')))
         self.log(f"📜 Found {len(pages)} pages to scan...")
         def process_page(page_url):
             if self._stop_event.is_set(): return []
             try:
                 self.log(f"  → Scanning: {page_url}")
-                html_content = self.get_page(page_url)
+                if page_url == self.base_url and first_html:
+                    html_content = first_html
+                else:
+                    html_content = self.get_page(page_url)
                 if not html_content: return []
                 threads = self.extract_thread_links(html_content, self.base_url)
                 self.log(f"  ✦ Found {len(threads)} threads on this page")
-                time.sleep(self.delay)
                 return threads
             except Exception as e:
                 self.log(f"  ⚠ Error: {e}"); return []
-            finally: self.force_gc()
         from concurrent.futures import ThreadPoolExecutor, as_completed
-        with ThreadPoolExecutor(max_workers=min(self.max_workers,6)) as executor:
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             futures = [executor.submit(process_page, url) for url in pages]
             for future in as_completed(futures):
                 if self._stop_event.is_set(): break
                 try: all_threads.extend(future.result())
                 except Exception as e: self.log(f"⚠ {e}")
-                finally: self.force_gc()
         seen, unique = set(), []
         for t in all_threads:
             if t['id'] not in seen:
@@ -345,33 +535,44 @@ class VBulletinBackup:
         return unique
     def get_thread_pages(self, thread_url, html_content):
         pages = [thread_url]; soup = None
+        owned = isinstance(html_content, (str, bytes))
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = make_soup(html_content, parse_only=_PAGE_LINKS) if owned else html_content
             page_numbers = set()
-            selectors = ['div.pagenav a[href]','div.pagination a[href]','div.pageNav a[href]',
-                         'div.pages a[href]','td.pagenav a[href]','table.pagenav a[href]',
-                         'ul.pagenav a[href]','nav.pagination a[href]',
-                         'a[href*="page="]','a[href*="&page="]','a[href*="/page-"]']
-            hrefs = set()
-            for sel in selectors:
-                for link in soup.select(sel):
-                    href = link.get('href')
-                    if href: hrefs.add(href)
+            hrefs = {link['href'] for link in soup.find_all('a', href=_PAGE_HREF)}
             for href in hrefs:
-                m = re.search(r'(?:[?&/](?:page|p)[=-]?)(\d+)', href)
+                m = _RE_PAGE_NUM.search(href)
                 if m: page_numbers.add(int(m.group(1)))
             if page_numbers:
-                base = re.sub(r'([?&/](?:page|p)[=-]?\d+)','',thread_url).rstrip('/')
+                base = _RE_PAGE_PARAM.sub('', thread_url).rstrip('/')
+                dashed = _RE_PAGE_DASH.search(thread_url) is not None
+                dash_base = _RE_PAGE_DASH.sub('', base)
+                sep = '&' if '?' in base else '?'
                 for i in range(2, max(page_numbers)+1):
-                    if re.search(r'/page-\d+', thread_url):
-                        pages.append(re.sub(r'/page-\d+','',base)+f"/page-{i}")
+                    if dashed:
+                        pages.append(dash_base+f"/page-{i}")
                     else:
-                        sep = '&' if '?' in base else '?'
                         pages.append(f"{base}{sep}page={i}")
         finally:
-            if soup: soup.decompose(); del soup
-            self.force_gc()
+            if owned and soup: soup.decompose()
         return pages
+    def _harvest_media(self, filepath, page_url, source=None):
+        # saved pages keep their media URL list in a .media.txt sidecar, so resumed runs skip the re-parse
+        sidecar = filepath[:-5] + '.media.txt'
+        if source is None and not self.rescan_media and os.path.exists(sidecar):
+            with open(sidecar, 'r', encoding='utf-8') as f:
+                urls = f.read().splitlines()
+        else:
+            if source is None:
+                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+                    source = f.read()
+            urls = self._media_dl.collect_media_urls(source, page_url)
+            try:
+                with open(sidecar, 'w', encoding='utf-8') as f:
+                    f.write('\n'.join(urls))
+            except OSError:
+                pass
+        self._media_dl.download_urls(urls)
     def download_thread(self, thread):
         if self._stop_event.is_set(): return False
         thread_id    = thread['id']
@@ -379,30 +580,30 @@ class VBulletinBackup:
         thread_title = thread['title']
         stitle       = safe_filename(thread_title)
         self.log(f"  ⬇ Thread {thread_id}: {thread_title[:55]}...")
-        html_content = thread_pages = None
-        try:
-            html_content = self.get_page(thread_url)
-            if not html_content: return False
+        html_content = self.get_page(thread_url)
+        if not html_content: return False
+        # with media on, page 1 is parsed once and reused for pagination and its media below;
+        # without it only the pagination links are needed, which the strained parse covers
+        if self._media_dl:
+            first_soup   = make_soup(html_content)
+            thread_pages = self.get_thread_pages(thread_url, first_soup)
+        else:
+            first_soup   = None
             thread_pages = self.get_thread_pages(thread_url, html_content)
-        finally:
-            if html_content: del html_content
-            self.force_gc()
         downloaded_pages = 0; previous_size = None
         for page_num, page_url in enumerate(thread_pages, 1):
             if self._stop_event.is_set(): break
             filename = f"thread_{thread_id}_{stitle}__page{page_num}.html"
             filepath = os.path.join(self.output_dir, filename)
-            page_content = None
+            is_first = page_num == 1 and page_url == thread_url
             try:
                 if os.path.exists(filepath):
                     downloaded_pages += 1
                     previous_size = os.path.getsize(filepath)
                     if self._media_dl and previous_size:
-                        with open(filepath,'r',encoding='utf-8',errors='ignore') as f:
-                            saved_html = f.read()
-                        self._media_dl.download_from_html(saved_html, page_url)
+                        self._harvest_media(filepath, page_url, first_soup if is_first else None)
                     continue
-                page_content = self.get_page(page_url)
+                page_content = html_content if is_first else self.get_page(page_url)
                 if not page_content: continue
                 current_size = len(page_content.encode('utf-8'))
                 if previous_size is not None and current_size == previous_size: break
@@ -410,13 +611,12 @@ class VBulletinBackup:
                     f.write(page_content)
                 downloaded_pages += 1; previous_size = current_size
                 if self._media_dl:
-                    self._media_dl.download_from_html(page_content, page_url)
-                time.sleep(self.delay)
+                    self._harvest_media(filepath, page_url, first_soup if is_first else page_content)
             except Exception as e:
                 self.log(f"  ⚠ Error on page {page_num}: {e}")
             finally:
-                if page_content: del page_content
-                self.force_gc()
+                if is_first and first_soup is not None:
+                    first_soup.decompose(); first_soup = None
         self.metadata['threads'][thread_id] = {
             'title':thread_title,'url':thread_url,
             'pages':downloaded_pages,'downloaded_at':datetime.now().isoformat()
@@ -442,8 +642,7 @@ class VBulletinBackup:
             except Exception as e:
                 self.log(f"⚠ Error on thread {thread['id']}: {e}")
                 return False, thread
-            finally: self.force_gc()
-        with ThreadPoolExecutor(max_workers=min(self.max_workers,8)) as executor:
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             future_to_thread = {executor.submit(download_single,t):t for t in threads_to_download}
             for future in as_completed(future_to_thread):
                 if self._stop_event.is_set(): break
@@ -459,9 +658,11 @@ class VBulletinBackup:
                     self.log(f"  ✦ Progress: {completed}/{len(threads_to_download)} threads")
                 except Exception as e:
                     self.log(f"⚠ {e}")
-                finally: self.force_gc()
         self.log(f"🏆 Backup complete! {successful}/{len(threads)} threads downloaded.")
         self.save_metadata()
+        if self._media_dl: self._media_dl.compact_index()
+        # one sweep once the crawl is done; refcounting frees the trees during it
+        self.force_gc()
         return successful
 
 
@@ -730,17 +931,8 @@ window.addEventListener('scroll', () => {
 btn.addEventListener('click', () => window.scrollTo({top:0, behavior:'smooth'}));
 """
 
-def _render_media_tag(url, local_path, embed_base64, media_dl):
+def _media_tag_html(url, src):
     ext = get_ext(url)
-    if embed_base64 and media_dl:
-        src = media_dl.get_base64_uri(url)
-    else:
-        src = None
-    if not src:
-        if local_path and os.path.exists(local_path):
-            src = 'media/' + os.path.basename(local_path)
-        else:
-            src = url
     if ext in IMAGE_EXTS:
         return f'<img src="{src}" alt="image" loading="lazy">'
     elif ext in VIDEO_EXTS:
@@ -748,12 +940,35 @@ def _render_media_tag(url, local_path, embed_base64, media_dl):
     elif ext in AUDIO_EXTS:
         return f'<audio src="{src}" controls></audio>'
     else:
-        fname = os.path.basename(urlparse(url).path) or 'file'
+        fname = os.path.basename(_split(url).path) or 'file'
         return f'<a class="media-link" href="{src}" download="{fname}">⬇ {fname}</a>'
+@functools.lru_cache(maxsize=4096)
+def _local_media_tag(url, local_path):
+    # the same avatars and attachments recur across posts; cleared per conversion run
+    if local_path and os.path.exists(local_path):
+        return _media_tag_html(url, 'media/' + os.path.basename(local_path))
+    return _media_tag_html(url, url)
+def _render_media_tag(url, local_path, embed_base64, media_dl):
+    src = media_dl.get_base64_uri(url) if embed_base64 and media_dl else None
+    if src:
+        return _media_tag_html(url, src)
+    return _local_media_tag(url, local_path)
+# vBulletin/XenForo class keyword tests, compiled once rather than lower()-ing every class per check
+_VB_POST_CLS    = re.compile(r'post|message', re.I)
+_VB_DIVPOST_CLS = re.compile(r'post|message-inner', re.I)
+_VB_SIDE_CLS    = re.compile(r'reply|sidebar|widget', re.I)
+_VB_AUTHOR_CLS  = re.compile(r'authorname|username|author-name', re.I)
+_VB_AUTHOR_ANY  = re.compile(r'author', re.I)
+_VB_DATE_CLS    = re.compile(r'post-date|date|time', re.I)
+_VB_BODY_CLS    = tuple(re.compile(kw, re.I) for kw in
+                        ("posttext", "fulltext", "bbcode", "bbwrapper", "message-body", "message-content"))
+_VB_CONTENT_CLS = re.compile(r'content', re.I)
+_VB_USER_CLS    = re.compile(r'user', re.I)
+_VB_SKIP_IMG    = re.compile(r'/avatar|/badge|/reaction|like\.png', re.I)
 def extract_posts_html(file_path, media_dl=None, embed_base64=False):
     with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
         raw = f.read()
-    soup = BeautifulSoup(raw, 'html.parser')
+    soup = make_soup(raw)
     
     # Extract base_url from og:url or canonical link before decomposing anything
     base_url = ""
@@ -796,9 +1011,8 @@ def extract_posts_html(file_path, media_dl=None, embed_base64=False):
             continue
             
         # Class check
-        is_post_class = any("post" in cls.lower() or "message" in cls.lower() for cls in classes)
-        is_sidebar_class = any("reply" in cls.lower() or "sidebar" in cls.lower() or "widget" in cls.lower() for cls in classes)
-        if is_post_class and not is_sidebar_class:
+        joined = " ".join(classes)
+        if _VB_POST_CLS.search(joined) and not _VB_SIDE_CLS.search(joined):
             post_containers.append(art)
             continue
             
@@ -814,9 +1028,8 @@ def extract_posts_html(file_path, media_dl=None, embed_base64=False):
                 post_containers.append(div)
                 continue
                 
-            is_post_class = any("post" in cls.lower() or "message-inner" in cls.lower() for cls in classes)
-            is_sidebar_class = any("reply" in cls.lower() or "sidebar" in cls.lower() or "widget" in cls.lower() for cls in classes)
-            if is_post_class and not is_sidebar_class:
+            joined = " ".join(classes)
+            if _VB_DIVPOST_CLS.search(joined) and not _VB_SIDE_CLS.search(joined):
                 post_containers.append(div)
                 continue
 
@@ -853,7 +1066,7 @@ def extract_posts_html(file_path, media_dl=None, embed_base64=False):
                 break
                 
         if author == "Unknown user":
-            author_el = block.find(class_=lambda c: c and any(kw in c.lower() for kw in ["authorname", "username", "author-name"]))
+            author_el = block.find(class_=lambda c: c and _VB_AUTHOR_CLS.search(c))
             if author_el:
                 author = author_el.get_text().strip().split('\n')[0].strip()
                 
@@ -872,7 +1085,7 @@ def extract_posts_html(file_path, media_dl=None, embed_base64=False):
                 parent_class = parent.get("class", [])
                 if isinstance(parent_class, str):
                     parent_class = [parent_class]
-                if parent.name == "aside" or any("author" in cls.lower() for cls in parent_class):
+                if parent.name == "aside" or _VB_AUTHOR_ANY.search(" ".join(parent_class)):
                     is_author_time = True
                     break
             if not is_author_time:
@@ -889,7 +1102,7 @@ def extract_posts_html(file_path, media_dl=None, embed_base64=False):
                 date_obj = parse_date(date_text)
                 
         if not date_text:
-            date_el = block.find(class_=lambda c: c and any(kw in c.lower() for kw in ["post-date", "date", "time"]))
+            date_el = block.find(class_=lambda c: c and _VB_DATE_CLS.search(c))
             if date_el:
                 date_text = date_el.text.strip()
                 date_obj = parse_date(date_text)
@@ -907,13 +1120,13 @@ def extract_posts_html(file_path, media_dl=None, embed_base64=False):
             
         # 3. Post Body Extraction
         body_div = None
-        for kw in ["posttext", "fulltext", "bbcode", "bbwrapper", "message-body", "message-content"]:
-            body_div = block.find(class_=lambda c: c and kw in c.lower())
+        for kw in _VB_BODY_CLS:
+            body_div = block.find(class_=lambda c: c and kw.search(c))
             if body_div:
                 break
                 
         if not body_div:
-            body_div = block.find(class_=lambda c: c and "content" in c.lower() and "user" not in c.lower())
+            body_div = block.find(class_=lambda c: c and _VB_CONTENT_CLS.search(c) and not _VB_USER_CLS.search(c))
             
         if not body_div:
             body_div = block.find_next('div', class_='bbWrapper')
@@ -929,7 +1142,7 @@ def extract_posts_html(file_path, media_dl=None, embed_base64=False):
         
         for img in media_container.find_all('img', src=True):
             img_src = img['src']
-            if any(x in img_src.lower() for x in ["/avatar", "/badge", "/reaction", "like.png"]):
+            if _VB_SKIP_IMG.search(img_src):
                 continue
             full_url = urljoin(base_url, img_src) if base_url else img_src
             local = media_dl.get_local_path(full_url) if media_dl else None
@@ -951,46 +1164,34 @@ def extract_posts_html(file_path, media_dl=None, embed_base64=False):
     posts.sort(key=lambda x: (x['date_obj'] is None, x['date_obj']))
     soup.decompose()
     return thread_title, posts
-def build_html_output(all_threads, generated_at, forum_url=""):
-    toc_items = ""
-    for idx, (title, _posts) in enumerate(all_threads):
-        anchor = f"thread-{idx}"
-        toc_items += f'<li><a href="#{anchor}">{title}</a></li>\n'
-    thread_blocks = ""
-    for idx, (title, posts) in enumerate(all_threads):
-        anchor    = f"thread-{idx}"
-        post_html = ""
-        for pi, post in enumerate(posts):
-            is_op   = pi == 0
-            cls     = "post original" if is_op else "post reply"
-            badge   = '<span class="post-badge badge-original">Original Post</span>' if is_op \
-                      else '<span class="post-badge badge-reply">Reply</span>'
-            media_html = ""
-            if post['media']:
-                media_html = '<div class="post-media">' + '\n'.join(post['media']) + '</div>'
-            safe_body = post['body'].replace('&','&amp;').replace('<','&lt;').replace('>','&gt;')
-
-            post_html += f"""
-<div class="{cls}">
-  <div class="post-meta">
-    {badge}
-    <span class="post-author">{post['author']}</span>
-    <span class="post-date">{post['date']}</span>
-  </div>
-  <div class="post-body">{safe_body}</div>
-  {media_html}
-</div>"""
-        thread_blocks += f"""
-<div class="thread-block" id="{anchor}">
+_POST_DIV_OP    = '<div class="post original">'
+_POST_DIV_REPLY = '<div class="post reply">'
+_BADGE_OP       = '<span class="post-badge badge-original">Original Post</span>'
+_BADGE_REPLY    = '<span class="post-badge badge-reply">Reply</span>'
+_THREAD_TMPL = """
+<div class="thread-block" id="thread-{idx}">
   <div class="thread-header">
     <span class="thread-sigil">ᛟ</span>
     <div class="thread-title">{title}</div>
-    <span class="thread-count">{len(posts)} post{'s' if len(posts)!=1 else ''}</span>
+    <span class="thread-count">{count} post{s}</span>
   </div>
-  {post_html}
+  """
+_POST_TMPL = """
+{div_open}
+  <div class="post-meta">
+    {badge}
+    <span class="post-author">{author}</span>
+    <span class="post-date">{date}</span>
+  </div>
+  <div class="post-body">{body}</div>
+  {media}
 </div>"""
+
+def write_html_output(out, all_threads, generated_at, forum_url=""):
+    # streamed piece by piece so the archive never exists as one giant string
     forum_line = f'<br><span style="color:var(--teal);font-size:12px">{forum_url}</span>' if forum_url else ""
-    return f"""<!DOCTYPE html>
+    write = out.write
+    write(f"""<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="UTF-8">
@@ -1009,10 +1210,27 @@ def build_html_output(all_threads, generated_at, forum_url=""):
   <nav id="toc">
     <h2>Thread Index — {len(all_threads)} scrolls</h2>
     <ul class="toc-list">
-{toc_items}
+""")
+    for idx, (title, _posts) in enumerate(all_threads):
+        write(f'<li><a href="#thread-{idx}">{title}</a></li>\n')
+    write("""
     </ul>
   </nav>
-{thread_blocks}
+""")
+    for idx, (title, posts) in enumerate(all_threads):
+        write(_THREAD_TMPL.format_map({
+            'idx': idx, 'title': title, 'count': len(posts), 's': 's' if len(posts) != 1 else ''}))
+        for pi, post in enumerate(posts):
+            div_open, badge = (_POST_DIV_OP, _BADGE_OP) if pi == 0 else (_POST_DIV_REPLY, _BADGE_REPLY)
+            media_html = ""
+            if post['media']:
+                media_html = '<div class="post-media">' + '\n'.join(post['media']) + '</div>'
+            write(_POST_TMPL.format_map({
+                'div_open': div_open, 'badge': badge,
+                'author': post['author'], 'date': post['date'],
+                'body': post['body'].translate(_HTML_ESCAPE), 'media': media_html}))
+        write("\n</div>")
+    write(f"""
 
 </div>
 <div id="lightbox"><img src="" alt=""></div>
@@ -1022,9 +1240,21 @@ def build_html_output(all_threads, generated_at, forum_url=""):
 </footer>
 <script>{HTML_JS}</script>
 </body>
-</html>"""
+</html>""")
+_WORKER_MEDIA = {}
+def _extract_posts_worker(path, embed_base64, media_root, media_dl=None):
+    # in a pool process the media index is loaded once per process, not pickled per file
+    if media_root and media_dl is None:
+        media_dl = _WORKER_MEDIA.get(media_root)
+        if media_dl is None:
+            media_dl = _WORKER_MEDIA[media_root] = MediaDownloader(media_root, log_callback=lambda m: None)
+    try:
+        return extract_posts_html(path, media_dl=media_dl, embed_base64=embed_base64), None
+    except Exception as e:
+        return None, str(e)
 def convert_html_folder(input_dir, output_file, log_callback=None, progress_callback=None,
                         stop_event=None, media_dl=None, embed_base64=False, forum_url=""):
+    from concurrent.futures import ProcessPoolExecutor, as_completed
     log = log_callback or print
     html_files = [os.path.join(input_dir, f)
                   for f in os.listdir(input_dir) if f.lower().endswith('.html')
@@ -1033,24 +1263,58 @@ def convert_html_folder(input_dir, output_file, log_callback=None, progress_call
         log("⚠ No HTML files found in the folder.")
         return 0
     log(f"📜 Found {len(html_files)} HTML files to convert...")
-    all_threads = []
-    for i, filepath in enumerate(sorted(html_files), 1):
-        if stop_event and stop_event.is_set():
-            break
+    html_files.sort()
+    _local_media_tag.cache_clear(); clean_text.cache_clear()
+    media_root = os.path.dirname(media_dl.media_dir) if media_dl else None
+    workers = min(os.cpu_count() or 1, len(html_files))
+    pool = None
+    def pooled(futures):
+        # progress follows completion; results are slotted back into file order below.
+        # A dead worker (OOM kill, unpicklable result) costs only its files: they are parsed here
+        broken = False
+        for f in as_completed(futures):
+            idx = futures[f]
+            try:
+                res = f.result()
+            except Exception as e:
+                if not broken:
+                    log(f"  ⚠ Parser process failed ({e!r}) — finishing the affected files here")
+                    broken = True
+                res = _extract_posts_worker(html_files[idx], embed_base64, media_root, media_dl)
+            yield (idx,) + res
+    if workers > 1:
         try:
-            title, posts = extract_posts_html(filepath, media_dl=media_dl, embed_base64=embed_base64)
-            if posts:
-                all_threads.append((title, posts))
-        except Exception as e:
-            log(f"  ⚠ Error in {os.path.basename(filepath)}: {e}")
-        if progress_callback:
-            progress_callback(i, len(html_files))
-        log(f"  ✦ Parsed {i}/{len(html_files)}: {os.path.basename(filepath)}")
+            pool = ProcessPoolExecutor(max_workers=workers)
+            futures = {pool.submit(_extract_posts_worker, fp, embed_base64, media_root): idx
+                       for idx, fp in enumerate(html_files)}
+            results = pooled(futures)
+        except Exception:
+            if pool: pool.shutdown(wait=False, cancel_futures=True)
+            pool = None
+    if pool is None:
+        results = ((idx,) + _extract_posts_worker(fp, embed_base64, media_root, media_dl)
+                   for idx, fp in enumerate(html_files))
+    parsed_by_idx = [None] * len(html_files)
+    try:
+        for i, (idx, parsed, err) in enumerate(results, 1):
+            if stop_event and stop_event.is_set():
+                break
+            filepath = html_files[idx]
+            if err:
+                log(f"  ⚠ Error in {os.path.basename(filepath)}: {err}")
+            elif parsed[1]:
+                parsed_by_idx[idx] = parsed
+            if progress_callback:
+                progress_callback(i, len(html_files))
+            log(f"  ✦ Parsed {i}/{len(html_files)}: {os.path.basename(filepath)}")
+    finally:
+        if pool: pool.shutdown(wait=False, cancel_futures=True)
+    all_threads = [t for t in parsed_by_idx if t]
     log("🎨 Weaving the HTML grimoire...")
     generated_at = datetime.now().strftime("%B %d, %Y at %H:%M")
-    html_out = build_html_output(all_threads, generated_at, forum_url)
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_out)
+    # big buffer: the writer emits many small chunks
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        write_html_output(f, all_threads, generated_at, forum_url)
     size_mb = os.path.getsize(output_file) / 1024 / 1024
     log(f"✅ HTML grimoire sealed! {output_file}  ({size_mb:.1f} MB,  {len(all_threads)} threads)")
     return len(all_threads)
@@ -1065,159 +1329,328 @@ import os
 import random
 import string
 
+_BB_WRAP = {
+    "b": ("[B]", "[/B]"), "strong": ("[B]", "[/B]"),
+    "i": ("[I]", "[/I]"), "em": ("[I]", "[/I]"),
+    "u": ("[U]", "[/U]"),
+    "s": ("[S]", "[/S]"), "strike": ("[S]", "[/S]"), "del": ("[S]", "[/S]"),
+    "blockquote": ("[QUOTE]", "[/QUOTE]"),
+    "code": ("[CODE]", "[/CODE]"), "pre": ("[CODE]", "[/CODE]"),
+    "ul": ("[LIST]\n", "[/LIST]\n"), "ol": ("[LIST]\n", "[/LIST]\n"),
+    **{f"h{n}": (f"[SIZE={7-n}][B]", "[/B][/SIZE]\n") for n in range(1, 7)},
+}
+# tags whose rendered inner text is stripped before wrapping
+_BB_STRIP = {"p": ("", "\n\n"), "li": ("[*]", "\n")}
+_BB_SKIP  = {"script", "style", "head", "meta", "link", "noscript"}
 def _html_to_bbcode(element):
-    from bs4 import NavigableString, Tag
-
-    if isinstance(element, NavigableString):
-        return str(element)
-
-    if not isinstance(element, Tag):
-        return ""
-    tag  = element.name.lower() if element.name else ""
-    inner = "".join(_html_to_bbcode(c) for c in element.children)
-    if tag in ("b", "strong"):
-        return f"[B]{inner}[/B]"
-    if tag in ("i", "em"):
-        return f"[I]{inner}[/I]"
-    if tag == "u":
-        return f"[U]{inner}[/U]"
-    if tag in ("s", "strike", "del"):
-        return f"[S]{inner}[/S]"
-    if tag == "a":
-        href = element.get("href", "")
-        return f"[URL={href}]{inner}[/URL]" if href else inner
-    if tag == "img":
-        src = element.get("src", "")
-        if src.startswith("data:"):
-            return "[IMG]<embedded>[/IMG]"
-        return f"[IMG]{src}[/IMG]"
-    if tag == "blockquote":
-        return f"[QUOTE]{inner}[/QUOTE]"
-    if tag in ("code", "pre"):
-        return f"[CODE]{inner}[/CODE]"
-    if tag in ("h1","h2","h3","h4","h5","h6"):
-        size = {"h1":"6","h2":"5","h3":"4","h4":"3","h5":"2","h6":"1"}.get(tag,"4")
-        return f"[SIZE={size}][B]{inner}[/B][/SIZE]\n"
-    if tag == "br":
-        return "\n"
-    if tag == "p":
-        return inner.strip() + "\n\n"
-    if tag in ("ul", "ol"):
-        return f"[LIST]\n{inner}[/LIST]\n"
-    if tag == "li":
-        return f"[*]{inner.strip()}\n"
-    if tag in ("div", "span", "section", "article"):
-        return inner
-    if tag in ("script","style","head","meta","link","noscript"):
-        return ""
-    return inner
+    # explicit stack instead of recursion: deep quote nests can't hit the recursion limit.
+    # str frames are closing tokens, tuple frames collapse a stripped span of buf
+    buf, stack = [], [element]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, NavigableString):
+            buf.append(str(node))
+            continue
+        if isinstance(node, str):
+            buf.append(node)
+            continue
+        if isinstance(node, tuple):
+            start, prefix, suffix = node
+            inner = "".join(buf[start:]).strip()
+            del buf[start:]
+            buf.append(prefix + inner + suffix)
+            continue
+        if not isinstance(node, Tag):
+            continue
+        tag = node.name.lower() if node.name else ""
+        if tag in _BB_SKIP:
+            continue
+        if tag == "br":
+            buf.append("\n")
+            continue
+        if tag == "img":
+            src = node.get("src", "")
+            buf.append("[IMG]<embedded>[/IMG]" if src.startswith("data:") else f"[IMG]{src}[/IMG]")
+            continue
+        if tag in _BB_STRIP:
+            stack.append((len(buf),) + _BB_STRIP[tag])
+        else:
+            wrap = _BB_WRAP.get(tag)
+            if tag == "a":
+                href = node.get("href", "")
+                wrap = (f"[URL={href}]", "[/URL]") if href else None
+            if wrap:
+                buf.append(wrap[0])
+                stack.append(wrap[1])
+        stack.extend(reversed(node.contents))
+    return "".join(buf)
+_BLANKLINE_RE = re.compile(r'\n{3,}')
 def _clean_bbcode(text):
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    return text.strip()
+    return _BLANKLINE_RE.sub('\n\n', text).strip()
 def _random_media_name(ext):
     hex_part = ''.join(random.choices(string.hexdigits[:16], k=14))
     digit_part = ''.join(random.choices(string.digits, k=8))
     name = hex_part + digit_part
     return name + ext
+# the handful of types forums actually embed; anything else goes through mimetypes once
+_MIME_EXT = {"image/jpeg": ".jpg", "image/png": ".png", "image/gif": ".gif", "image/webp": ".webp",
+             "image/svg+xml": ".svg", "video/mp4": ".mp4", "video/webm": ".webm"}
+_DEFAULT_EXT = ".bin"
+@functools.lru_cache(maxsize=64)
+def _guess_ext(mime):
+    ext = mimetypes.guess_extension(mime) or _DEFAULT_EXT
+    return {".jpe": ".jpg", ".jpeg": ".jpg"}.get(ext, ext)
+_O_BINARY = getattr(os, "O_BINARY", 0)  # Windows would otherwise translate newlines
 def _extract_b64_media(src_attr, recovered_dir, log):
     if not src_attr.startswith("data:"):
         return None, None
     try:
         header, b64data = src_attr.split(",", 1)
         mime = header.split(":")[1].split(";")[0].strip()
-        ext  = mimetypes.guess_extension(mime) or ".bin"
-        ext  = {".jpe": ".jpg", ".jpeg": ".jpg"}.get(ext, ext)
+        ext  = _MIME_EXT.get(mime) or _guess_ext(mime)
         fname = _random_media_name(ext)
         fpath = os.path.join(recovered_dir, fname)
-        raw   = base64.b64decode(b64data + "==")
-        with open(fpath, "wb") as f:
-            f.write(raw)
+        # pad only when needed, so already-padded payloads aren't copied just to append "=="
+        pad = -len(b64data) % 4
+        try:
+            raw = base64.b64decode(b64data + "=" * pad if pad else b64data)
+        except binascii.Error:  # stray whitespace throws the length-based padding off
+            raw = base64.b64decode(b64data + "==")
+        fd = os.open(fpath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o644)
+        try:
+            view = memoryview(raw)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
         log(f"    ✦ Materialised {mime} → {fname}")
         return fpath, mime
     except Exception as e:
         log(f"    ⚠ Base64 decode failed: {e}")
         return None, None
+_RE_ARCANE_BLOCK = re.compile(rb'<div\s[^>]*class=["\'][^"\']*\bthread-block\b')
+_ARCANE_STRAINER = SoupStrainer("div", class_="thread-block")
+# Arcane blocks are read as (title, post iterator) pairs; each post is a dict of plain strings
+def _arcane_threads_bs4(soup):
+    def text(el):
+        return el.get_text() if el else None
+    def posts(block):
+        for post_div in block.find_all("div", class_="post"):
+            media = post_div.find(class_="post-media")
+            yield {
+                "author": text(post_div.find(class_="post-author")),
+                "date":   text(post_div.find(class_="post-date")),
+                "body":   text(post_div.find(class_="post-body")),
+                "imgs":   [t.get("src","") for t in media.find_all("img")] if media else [],
+                "vids":   [t.get("src","") for t in media.find_all(["video","source"])] if media else [],
+                "is_op":  "original" in (post_div.get("class") or []),
+            }
+        block.decompose()  # thread consumed; let its subtree go before the next one
+    return [(text(b.find(class_="thread-title")), posts(b))
+            for b in soup.find_all("div", class_="thread-block")]
+def _xp_class(cls):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')"
+if etree is not None:
+    _XP_ARCANE_BLOCKS = etree.XPath(f"//div[{_xp_class('thread-block')}]")
+    _XP_ARCANE_POSTS  = etree.XPath(f".//div[{_xp_class('post')}]")
+    _XP_FIRST = {c: etree.XPath(f"(.//*[{_xp_class(c)}])[1]")
+                 for c in ("thread-title", "post-author", "post-date", "post-body", "post-media")}
+    # bs4's get_text() skips script/style/template contents, so match it
+    _XP_TEXT  = etree.XPath(".//text()[not(ancestor::script or ancestor::style or ancestor::template)]")
+    _XP_IMGS  = etree.XPath(".//img")
+    _XP_VIDS  = etree.XPath(".//*[self::video or self::source]")
+def _xp_first(el, cls):
+    hit = _XP_FIRST[cls](el)
+    return hit[0] if hit else None
+def _xp_text(el):
+    return "".join(_XP_TEXT(el)) if el is not None else None
+def _arcane_block_lxml(block):
+    posts = []
+    for post_div in _XP_ARCANE_POSTS(block):
+        media = _xp_first(post_div, "post-media")
+        posts.append({
+            "author": _xp_text(_xp_first(post_div, "post-author")),
+            "date":   _xp_text(_xp_first(post_div, "post-date")),
+            "body":   _xp_text(_xp_first(post_div, "post-body")),
+            "imgs":   [t.get("src","") for t in _XP_IMGS(media)] if media is not None else [],
+            "vids":   [t.get("src","") for t in _XP_VIDS(media)] if media is not None else [],
+            "is_op":  "original" in (post_div.get("class") or "").split(),
+        })
+    return _xp_text(_xp_first(block, "thread-title")), posts
+_PULL_CHUNK      = 1 << 16
+_PULL_LOG_EVERY  = 32 << 20
+def _arcane_threads_pull(f, log):
+    # libxml2 is fed the file in chunks and each thread block is handed out as soon as it closes,
+    # then dropped, so memory follows one block rather than the whole grimoire
+    parser = etree.HTMLPullParser(events=("end",), tag="div", encoding="utf-8", huge_tree=True)
+    fed = 0
+    while True:
+        chunk = f.read(_PULL_CHUNK)
+        if chunk:
+            parser.feed(chunk)
+        else:
+            parser.close()
+        for _event, el in parser.read_events():
+            if "thread-block" not in (el.get("class") or "").split():
+                continue
+            yield _arcane_block_lxml(el)
+            el.clear()
+            parent = el.getparent()
+            while parent is not None and el.getprevious() is not None:
+                del parent[0]
+        if not chunk:
+            return
+        fed += len(chunk)
+        if fed % _PULL_LOG_EVERY < _PULL_CHUNK:
+            log(f"  ᛟ  {fed >> 20} MB of the scroll read...")
+# thread blocks are independent, so big grimoires are cut at block starts and parsed side by side
+_SPLIT_MIN_BYTES = 16 << 20
+_SPLIT_PER_PROC  = 4
+def _arcane_range(html_filepath, start, end):
+    with open(html_filepath, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    return list(_arcane_threads_pull(io.BytesIO(data), lambda m: None))
+def _arcane_threads_split(f, html_filepath, log):
+    # None when a single libxml2 stream is the better deal (small file, one core, no blocks)
+    procs = min(os.cpu_count() or 1, 8)
+    size  = os.fstat(f.fileno()).st_size
+    if procs < 2 or size < _SPLIT_MIN_BYTES:
+        return None
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        starts = [m.start() for m in _RE_ARCANE_BLOCK.finditer(mm)]
+    if len(starts) < 2:
+        return None
+    step   = size // (procs * _SPLIT_PER_PROC) + 1
+    ranges = []
+    lo = starts[0]
+    for off in starts[1:]:
+        if off - lo >= step:
+            ranges.append((lo, off))
+            lo = off
+    ranges.append((lo, size))
+    if len(ranges) < 2:
+        return None
+    log(f"  ᛟ  {len(starts)} thread block(s) split across {min(procs, len(ranges))} processes")
+    return _arcane_ranges_iter(html_filepath, ranges, min(procs, len(ranges)), log)
+def _arcane_ranges_iter(html_filepath, ranges, procs, log):
+    from concurrent.futures import ProcessPoolExecutor
+    pool = ProcessPoolExecutor(max_workers=procs)
+    done = False
+    try:
+        futs = [pool.submit(_arcane_range, html_filepath, lo, hi) for lo, hi in ranges]
+        for i, fut in enumerate(futs):
+            try:
+                blocks = fut.result()
+            except Exception as e:
+                # a lost worker mustn't truncate the archive: read the ranges still owed right here
+                log(f"  ⚠ Split parse failed ({e!r}) — reading the rest in this process")
+                pool.shutdown(wait=False, cancel_futures=True)
+                for lo, hi in ranges[i:]:
+                    yield from _arcane_range(html_filepath, lo, hi)
+                break
+            yield from blocks
+        done = True
+    finally:
+        # a drained pool is joined; only a stopped or failed read abandons the pending ranges
+        if done:
+            pool.shutdown(wait=True)
+        else:
+            pool.shutdown(wait=False, cancel_futures=True)
 def _parse_single_html(html_filepath, log, se):
     html_dir      = os.path.dirname(os.path.abspath(html_filepath))
     recovered_dir = os.path.join(html_dir, "recovered_media")
     os.makedirs(recovered_dir, exist_ok=True)
-
+    all_threads = list(_iter_single_html(html_filepath, recovered_dir, log, se))
+    return all_threads, sum(t["post_count"] for t in all_threads), recovered_dir
+def _has_arcane_blocks(f):
+    # one scan of the mapped file picks the route, so foreign pages never start a libxml2 stream
+    try:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _RE_ARCANE_BLOCK.search(mm) is not None
+    except (ValueError, OSError):  # empty file
+        return False
+def _iter_single_html(html_filepath, recovered_dir, log, se):
+    # yields each thread as soon as it is parsed, so the CSV path never holds the whole archive
     log(f"ᚱ  Opening scroll: {os.path.basename(html_filepath)}")
     try:
-        with open(html_filepath, "r", encoding="utf-8", errors="ignore") as f:
-            raw_html = f.read()
+        # raw bytes go straight to libxml2, which decodes them in C
+        f = open(html_filepath, "rb")
     except Exception as e:
         log(f"⚠  Cannot open file: {e}")
-        return [], [], 0, recovered_dir
-    all_threads = []
-    csv_rows    = []
-    total_posts = 0
+        return
     try:
-        soup = BeautifulSoup(raw_html, "html.parser")
-        arcane_threads = soup.find_all("div", class_="thread-block")
-        is_arcane = len(arcane_threads) > 0
-        if is_arcane:
-            log(f"ᛊ  Arcane Archive format detected — {len(arcane_threads)} thread block(s)")
-            for t_idx, t_block in enumerate(arcane_threads):
+        # our own grimoires stream through libxml2 block by block; anything else needs the full tree
+        soup = arcane_threads = None
+        arcane = _has_arcane_blocks(f)
+        if etree is not None and arcane:
+            try:
+                stream = _arcane_threads_split(f, html_filepath, log)
+                first  = next(stream, None) if stream is not None else None
+            except Exception:
+                first  = None  # no worker processes here; fall back to the single stream
+            if first is None:
+                f.seek(0)
+                stream = _arcane_threads_pull(f, log)
+                try:
+                    first = next(stream, None)
+                except Exception:
+                    first = None  # libxml2 choked; the bs4 paths below get their turn
+            if first is not None:
+                arcane_threads = itertools.chain((first,), stream)
+        if arcane_threads is None:
+            f.seek(0)
+            raw_html = f.read()
+            if arcane:
+                soup = make_soup(raw_html, parse_only=_ARCANE_STRAINER, from_encoding="utf-8")
+                arcane_threads = _arcane_threads_bs4(soup)
+            if not arcane_threads:
+                if soup: soup.decompose()
+                soup = make_soup(raw_html, from_encoding="utf-8")
+                arcane_threads = _arcane_threads_bs4(soup)
+            raw_html = None
+        if arcane_threads:
+            log("ᛊ  Arcane Archive format detected")
+            # blocks stream in, so their count is only known once the scroll is drained
+            n_blocks = 0
+            for t_idx, (title_text, post_iter) in enumerate(arcane_threads):
                 if se.is_set(): break
-                title_el     = t_block.find(class_="thread-title")
-                thread_title = clean_text(title_el.get_text()) if title_el else f"Thread {t_idx+1}"
-                post_divs  = t_block.find_all("div", class_="post")
+                n_blocks += 1
+                thread_title = clean_text(title_text) if title_text is not None else f"Thread {t_idx+1}"
                 posts_data = []
-                for p_idx, post_div in enumerate(post_divs):
+                for p_idx, post in enumerate(post_iter):
                     if se.is_set(): break
-                    author_el = post_div.find(class_="post-author")
-                    date_el   = post_div.find(class_="post-date")
-                    body_el   = post_div.find(class_="post-body")
-                    author   = clean_text(author_el.get_text()) if author_el else "Unknown Scribe"
+                    author   = clean_text(post["author"]) if post["author"] is not None else "Unknown Scribe"
                     author   = author.lstrip("⟁ ").strip()
-                    date_str = clean_text(date_el.get_text()) if date_el else "Date unknown"
+                    date_str = clean_text(post["date"]) if post["date"] is not None else "Date unknown"
                     date_str = date_str.lstrip("· ").strip()
                     bbcode_body = ""
                     media_refs  = []
-                    if body_el:
-                        media_container = post_div.find(class_="post-media")
-                        if media_container:
-                            for img_tag in media_container.find_all("img"):
-                                src = img_tag.get("src","")
-                                if src.startswith("data:"):
-                                    fpath, mime = _extract_b64_media(src, recovered_dir, log)
-                                    if fpath:
-                                        rel = os.path.join("recovered_media", os.path.basename(fpath))
-                                        media_refs.append({"type":"image","source":"base64","mime":mime,"local_path":rel})
-                                elif src:
-                                    media_refs.append({"type":"image","source":"url","url":src})
-                            for vid in media_container.find_all(["video","source"]):
-                                src = vid.get("src","")
+                    if post["body"] is not None:
+                        for kind, srcs in (("image", post["imgs"]), ("video", post["vids"])):
+                            for src in srcs:
                                 if src.startswith("data:"):
                                     fpath, mime = _extract_b64_media(src, recovered_dir, log)
                                     if fpath:
                                         rel = os.path.join("recovered_media", os.path.basename(fpath))
-                                        media_refs.append({"type":"video","source":"base64","mime":mime,"local_path":rel})
+                                        media_refs.append({"type":kind,"source":"base64","mime":mime,"local_path":rel})
                                 elif src:
-                                    media_refs.append({"type":"video","source":"url","url":src})
-                        raw_body = body_el.get_text()
-                        bbcode_body = _clean_bbcode(raw_body)
-                    is_op = "original" in (post_div.get("class") or [])
+                                    media_refs.append({"type":kind,"source":"url","url":src})
+                        bbcode_body = _clean_bbcode(post["body"])
                     posts_data.append({
                         "index": p_idx, "author": author, "date": date_str,
-                        "bbcode": bbcode_body, "media": media_refs, "is_original": is_op,
-                    })
-                    media_str = " | ".join(r.get("local_path") or r.get("url","") for r in media_refs)
-                    csv_rows.append({
-                        "thread_title": thread_title, "post_author": author,
-                        "post_date": date_str, "post_content_bbcode": bbcode_body[:2000],
-                        "media_references": media_str,
+                        "bbcode": bbcode_body, "media": media_refs, "is_original": post["is_op"],
                     })
                 if posts_data:
                     log(f"  ✦ Thread '{thread_title[:55]}' — {len(posts_data)} posts")
-                all_threads.append({
+                yield {
                     "thread_title": thread_title,
                     "source_file":  os.path.basename(html_filepath),
                     "post_count":   len(posts_data),
                     "posts":        posts_data,
-                })
-                total_posts += len(posts_data)
+                }
+            if not se.is_set():
+                log(f"ᛊ  Arcane Archive read — {n_blocks} thread block(s)")
         else:
             log("ᛊ  Raw vBulletin format detected")
             # Extract base_url from og:url or canonical link before decomposing
@@ -1257,9 +1690,8 @@ def _parse_single_html(html_filepath, log, se):
                     continue
                     
                 # Class check
-                is_post_class = any("post" in cls.lower() or "message" in cls.lower() for cls in classes)
-                is_sidebar_class = any("reply" in cls.lower() or "sidebar" in cls.lower() or "widget" in cls.lower() for cls in classes)
-                if is_post_class and not is_sidebar_class:
+                joined = " ".join(classes)
+                if _VB_POST_CLS.search(joined) and not _VB_SIDE_CLS.search(joined):
                     post_containers.append(art)
                     continue
                     
@@ -1275,9 +1707,8 @@ def _parse_single_html(html_filepath, log, se):
                         post_containers.append(div)
                         continue
                         
-                    is_post_class = any("post" in cls.lower() or "message-inner" in cls.lower() for cls in classes)
-                    is_sidebar_class = any("reply" in cls.lower() or "sidebar" in cls.lower() or "widget" in cls.lower() for cls in classes)
-                    if is_post_class and not is_sidebar_class:
+                    joined = " ".join(classes)
+                    if _VB_DIVPOST_CLS.search(joined) and not _VB_SIDE_CLS.search(joined):
                         post_containers.append(div)
                         continue
 
@@ -1315,7 +1746,7 @@ def _parse_single_html(html_filepath, log, se):
                         break
                         
                 if author == "Unknown Scribe":
-                    author_el = block.find(class_=lambda c: c and any(kw in c.lower() for kw in ["authorname", "username", "author-name"]))
+                    author_el = block.find(class_=lambda c: c and _VB_AUTHOR_CLS.search(c))
                     if author_el:
                         author = author_el.get_text().strip().split('\n')[0].strip()
                         
@@ -1334,7 +1765,7 @@ def _parse_single_html(html_filepath, log, se):
                         parent_class = parent.get("class", [])
                         if isinstance(parent_class, str):
                             parent_class = [parent_class]
-                        if parent.name == "aside" or any("author" in cls.lower() for cls in parent_class):
+                        if parent.name == "aside" or _VB_AUTHOR_ANY.search(" ".join(parent_class)):
                             is_author_time = True
                             break
                     if not is_author_time:
@@ -1345,7 +1776,7 @@ def _parse_single_html(html_filepath, log, se):
                 if correct_time_tag:
                     date_str = correct_time_tag.text.strip()
                 else:
-                    date_el = block.find(class_=lambda c: c and any(kw in c.lower() for kw in ["post-date", "date", "time"]))
+                    date_el = block.find(class_=lambda c: c and _VB_DATE_CLS.search(c))
                     if date_el:
                         date_str = date_el.text.strip()
                     else:
@@ -1357,13 +1788,13 @@ def _parse_single_html(html_filepath, log, se):
                                 
                 # 3. Post Body / Content Extraction
                 body_div = None
-                for kw in ["posttext", "fulltext", "bbcode", "bbwrapper", "message-body", "message-content"]:
-                    body_div = block.find(class_=lambda c: c and kw in c.lower())
+                for kw in _VB_BODY_CLS:
+                    body_div = block.find(class_=lambda c: c and kw.search(c))
                     if body_div:
                         break
                         
                 if not body_div:
-                    body_div = block.find(class_=lambda c: c and "content" in c.lower() and "user" not in c.lower())
+                    body_div = block.find(class_=lambda c: c and _VB_CONTENT_CLS.search(c) and not _VB_USER_CLS.search(c))
                     
                 if not body_div:
                     body_div = block.find_next('div', class_='bbWrapper')
@@ -1378,7 +1809,7 @@ def _parse_single_html(html_filepath, log, se):
                     # Media References Finder
                     for img_tag in body_div.find_all("img"):
                         src = img_tag.get("src", "")
-                        if any(x in src.lower() for x in ["/avatar", "/badge", "/reaction", "like.png"]):
+                        if _VB_SKIP_IMG.search(src):
                             continue
                         if src.startswith("data:"):
                             fpath, mime = _extract_b64_media(src, recovered_dir, log)
@@ -1415,25 +1846,22 @@ def _parse_single_html(html_filepath, log, se):
                     "index": block_idx, "author": author, "date": date_str,
                     "bbcode": bbcode_body, "media": media_refs, "is_original": block_idx == 0,
                 })
-                
-                media_str = " | ".join(r.get("local_path") or r.get("url", "") for r in media_refs)
-                csv_rows.append({
-                    "thread_title": thread_title, "post_author": author,
-                    "post_date": date_str, "post_content_bbcode": bbcode_body[:2000],
-                    "media_references": media_str,
-                })
-            all_threads.append({
+                # free the block now unless the next container is nested inside it
+                nxt = post_containers[block_idx + 1] if block_idx + 1 < len(post_containers) else None
+                if nxt is None or not any(p is block for p in nxt.parents):
+                    block.decompose()
+            log(f"  ✦ Extracted {len(posts_data)} posts from '{thread_title[:55]}'")
+            yield {
                 "thread_title": thread_title,
                 "source_file":  os.path.basename(html_filepath),
                 "post_count":   len(posts_data),
                 "posts":        posts_data,
-            })
-            total_posts += len(posts_data)
-            log(f"  ✦ Extracted {total_posts} posts from '{thread_title[:55]}'")
-        soup.decompose()
+            }
+        if soup: soup.decompose()
     except Exception as e:
         log(f"⚠  Parse error: {e}")
-    return all_threads, csv_rows, total_posts, recovered_dir
+    finally:
+        f.close()
 def restoration_write_json(all_threads, total_posts, out_path, log):
     log("ᛊ  Inscribing the JSON codex...")
     try:
@@ -1443,22 +1871,128 @@ def restoration_write_json(all_threads, total_posts, out_path, log):
             "total_posts":   total_posts,
             "threads":       all_threads,
         }
-        with open(out_path, "w", encoding="utf-8") as jf:
-            json.dump(payload, jf, indent=2, ensure_ascii=False)
+        # one encoded blob instead of json.dump's thousands of small text-mode writes
+        if orjson is not None:
+            data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+        with open(out_path, "wb", buffering=1 << 20) as jf:
+            jf.write(data)
         size_kb = os.path.getsize(out_path) / 1024
         log(f"  ✅ JSON codex sealed: {os.path.basename(out_path)}  ({size_kb:.1f} KB)")
         return out_path
     except Exception as e:
         log(f"  ⚠ JSON write failed: {e}")
         return None
-def restoration_write_csv(csv_rows, out_path, log):
+# Restoration parses run in one long-lived worker process, created on first use, so the parser never
+# competes with Tk for the GIL. Log lines and the stop flag cross the process boundary through these.
+_RESTORE_POOL = _RESTORE_LOG_Q = _RESTORE_STOP = None
+_RESTORE_POOL_LOCK = threading.Lock()
+class _SharedStopFlag:
+    # Event-shaped stop flag in shared memory. The parser polls it once per post; mp.Event.is_set()
+    # takes a semaphore round trip every time, this is a plain read of one byte
+    def __init__(self):
+        self._v = mp.RawValue('b', 0)
+    def is_set(self):
+        return self._v.value != 0
+    def set(self):
+        self._v.value = 1
+    def clear(self):
+        self._v.value = 0
+def _restore_worker_init(log_q, stop):
+    global _RESTORE_LOG_Q, _RESTORE_STOP
+    _RESTORE_LOG_Q, _RESTORE_STOP = log_q, stop
+def _restore_worker_call(fn, *args):
+    try:
+        return fn(*args, _RESTORE_LOG_Q.put, _RESTORE_STOP)
+    finally:
+        _RESTORE_LOG_Q.put(None)  # end of this parse's log stream
+def _restore_pool():
+    global _RESTORE_POOL, _RESTORE_LOG_Q, _RESTORE_STOP
+    from concurrent.futures import ProcessPoolExecutor
+    with _RESTORE_POOL_LOCK:
+        if _RESTORE_POOL is None:
+            _RESTORE_LOG_Q, _RESTORE_STOP = mp.Queue(), _SharedStopFlag()
+            _RESTORE_POOL = ProcessPoolExecutor(max_workers=1, initializer=_restore_worker_init,
+                                                initargs=(_RESTORE_LOG_Q, _RESTORE_STOP))
+        return _RESTORE_POOL
+def restoration_stop():
+    if _RESTORE_STOP is not None:
+        _RESTORE_STOP.set()
+def _restore_drop_pool(pool):
+    global _RESTORE_POOL
+    with _RESTORE_POOL_LOCK:
+        if _RESTORE_POOL is pool:
+            _RESTORE_POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+def _restore_run(fn, *args, log, se):
+    # fn(*args, log, se) in the worker process; this thread just relays its log and the stop request
+    from concurrent.futures.process import BrokenProcessPool
+    pool = None
+    try:
+        pool = _restore_pool()
+        _RESTORE_STOP.clear()
+        fut = pool.submit(_restore_worker_call, fn, *args)
+    except Exception:
+        if pool is not None:
+            _restore_drop_pool(pool)
+        return fn(*args, log, se)
+    while True:
+        if se.is_set():
+            _RESTORE_STOP.set()
+        try:
+            msg = _RESTORE_LOG_Q.get(timeout=0.1)
+        except Empty:
+            if fut.done() and fut.exception() is not None:
+                break  # worker died before it could sign off
+            continue
+        if msg is None:
+            break
+        log(msg)
+    try:
+        return fut.result()
+    except BrokenProcessPool:
+        # the worker itself died (OOM kill, crash); errors raised by fn propagate as they are
+        _restore_drop_pool(pool)
+        return fn(*args, log, se)
+def restoration_parse(html_filepath, log, se):
+    return _restore_run(_parse_single_html, html_filepath, log=log, se=se)
+def restoration_csv(html_filepath, out_path, log, se):
+    return _restore_run(_restoration_csv, html_filepath, out_path, log=log, se=se)
+_CSV_FIELDS = ("thread_title", "post_author", "post_date", "post_content_bbcode", "media_references")
+def _iter_csv_rows(all_threads):
+    # rows are derived from the parsed threads on demand rather than kept alongside them
+    for thread in all_threads:
+        title = thread["thread_title"]
+        for post in thread["posts"]:
+            yield (title, post["author"], post["date"], post["bbcode"][:2000],
+                   " | ".join(r.get("local_path") or r.get("url", "") for r in post["media"]))
+def _restoration_csv(html_filepath, out_path, log, se):
+    # parse and etch in one pass: each thread is written out and dropped as soon as it is parsed
+    recovered_dir = os.path.join(os.path.dirname(os.path.abspath(html_filepath)), "recovered_media")
+    os.makedirs(recovered_dir, exist_ok=True)
+    counts = [0, 0]
+    def threads():
+        for thread in _iter_single_html(html_filepath, recovered_dir, log, se):
+            counts[0] += 1
+            counts[1] += thread["post_count"]
+            yield thread
+    it    = threads()
+    first = next(it, None)
+    if first is None:
+        return None, 0, 0
+    result = restoration_write_csv(_iter_csv_rows(itertools.chain((first,), it)), out_path, log, se)
+    return result, counts[0], counts[1]
+def restoration_write_csv(csv_rows, out_path, log, se=None):
     log("ᚠ  Etching the CSV tablet...")
     try:
-        fieldnames = ["thread_title","post_author","post_date","post_content_bbcode","media_references"]
-        with open(out_path, "w", encoding="utf-8", newline="") as cf:
-            writer = csv.DictWriter(cf, fieldnames=fieldnames, quoting=csv.QUOTE_ALL)
-            writer.writeheader()
+        with open(out_path, "w", encoding="utf-8", newline="", buffering=1 << 20) as cf:
+            writer = csv.writer(cf, quoting=csv.QUOTE_ALL)
+            writer.writerow(_CSV_FIELDS)
             writer.writerows(csv_rows)
+        if se is not None and se.is_set():
+            os.remove(out_path)  # a half-etched tablet is worse than none
+            return None
         size_kb = os.path.getsize(out_path) / 1024
         log(f"  ✅ CSV tablet chiselled: {os.path.basename(out_path)}  ({size_kb:.1f} KB)")
         return out_path
@@ -1471,13 +2005,18 @@ def restoration_write_csv(csv_rows, out_path, log):
 #  WEBSITE MIRROR ENGINE  (ᚹ)
 # ─────────────────────────────────────────────
 
+_SKIP_SCHEMES = ("mailto:", "tel:", "javascript:", "#", "data:")
+# per-worker read buffer for streamed asset downloads
+_MIRROR_CHUNK = 1 << 16
 class MirrorCrawler:
     def __init__(self, base_url, output_dir="mirror",
                  max_workers=8, delay=0.5,
                  log_callback=None, stop_event=None,
                  progress_callback=None):
         self.base_url          = base_url.rstrip("/")
-        self.base_domain       = urlparse(base_url).netloc
+        _parsed                = urlparse(base_url)
+        self.base_domain       = _parsed.netloc
+        self._base_prefix      = f"{_parsed.scheme}://{_parsed.netloc}/"
         self.output_dir        = output_dir
         self.max_workers       = max_workers
         self.delay             = delay
@@ -1489,11 +2028,71 @@ class MirrorCrawler:
         self.queue             = Queue()
         self._downloaded       = 0
         self._count_lock       = threading.Lock()
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"})
+        # keep-alive pool sized to the workers, so each one reuses a warm connection per host
+        self.session = make_session(max(1, max_workers), "Mozilla/5.0 (Windows NT 10.0; Win64; x64)")
+        # shared per-host spacing instead of every worker sleeping after each fetch
+        self._limiter = HostRateLimiter(delay / max(1, max_workers), self._stop)
+        # the same asset URLs recur on nearly every page
+        self._url_to_path = functools.lru_cache(maxsize=4096)(self._url_to_path)
+        # pages in one folder share their relative links to the same assets
+        self._rel_link    = functools.lru_cache(maxsize=8192)(self._rel_link)
+        # ETags of assets saved by earlier runs, so revisits can be answered with a 304
+        self._etag_file  = os.path.join(output_dir, "_etags.jsonl")
+        self._etag_fp    = None
+        self._etag_lock  = threading.Lock()
+        self._etags      = self._load_etags()
+        # folders already created this run; most assets land in a handful of them
+        self._made_dirs  = set()
+    def _ensure_dir(self, d):
+        if d not in self._made_dirs:
+            os.makedirs(d, exist_ok=True)
+            self._made_dirs.add(d)
+    def _load_etags(self):
+        etags = {}
+        if os.path.exists(self._etag_file):
+            try:
+                with open(self._etag_file, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try: etags.update(json.loads(line))
+                        except ValueError: pass
+            except OSError:
+                pass
+        return etags
+    def _record_etag(self, url, etag):
+        if self._etags.get(url) == etag:
+            return
+        self._etags[url] = etag
+        line = json.dumps({url: etag}, ensure_ascii=False) + "\n"
+        with self._etag_lock:
+            try:
+                if self._etag_fp is None:
+                    self._etag_fp = open(self._etag_file, "a", encoding="utf-8")
+                self._etag_fp.write(line)
+            except OSError:
+                pass
+    def _close_etags(self):
+        # fold the appended lines back into one entry per URL
+        with self._etag_lock:
+            if self._etag_fp is None:
+                return
+            try:
+                self._etag_fp.close(); self._etag_fp = None
+                with open(self._etag_file, "w", encoding="utf-8") as f:
+                    for url, etag in self._etags.items():
+                        f.write(json.dumps({url: etag}, ensure_ascii=False) + "\n")
+            except OSError:
+                pass
     def _normalize(self, url):
         url, _ = urldefrag(url)
         return url.rstrip("/")
+    def _enqueue(self, url):
+        # dedupe on the way in: every page repeats the same nav and asset links, and
+        # those duplicates would otherwise pile up in the queue until a worker drops them
+        with self.visited_lock:
+            if url in self.visited:
+                return
+            self.visited.add(url)
+        self.queue.put(url)
     def _url_to_path(self, url):
         parsed = urlparse(url)
         path   = parsed.path or "/"
@@ -1505,14 +2104,43 @@ class MirrorCrawler:
             path = path + ".html"
         return os.path.join(self.output_dir, parsed.netloc.replace(":", "_") + path)
 
+    def _rel_link(self, child_path, current_dir):
+        return os.path.relpath(child_path, current_dir).replace("\\", "/")
     def _save(self, path, content):
         try:
-            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._ensure_dir(os.path.dirname(path))
             with open(path, "wb") as f:
                 f.write(content)
         except Exception as e:
             self.log(f"  ⚠ Save error ({os.path.basename(path)}): {e}")
+    def _save_stream(self, path, resp, buf):
+        # assets go to disk through the worker's own chunk buffer instead of one bytes per file;
+        # written beside the target and renamed over it only once complete, so an aborted
+        # download leaves any earlier copy in place. Returns whether the file landed
+        done = False
+        part = path + ".part"
+        try:
+            self._ensure_dir(os.path.dirname(path))
+            resp.raw.decode_content = True
+            view = memoryview(buf)
+            with open(part, "wb") as f:
+                while not self._stop.is_set():
+                    n = resp.raw.readinto(buf)
+                    if not n:
+                        done = True
+                        break
+                    f.write(view[:n])
+            if done:
+                os.replace(part, path)
+        except Exception as e:
+            done = False
+            self.log(f"  ⚠ Save error ({os.path.basename(path)}): {e}")
+        if not done:
+            try: os.remove(part)
+            except OSError: pass
+        return done
     def _worker(self):
+        buf = bytearray(_MIRROR_CHUNK)
         while not self._stop.is_set():
             try:
                 url = self.queue.get(timeout=2)
@@ -1523,51 +2151,59 @@ class MirrorCrawler:
             if url is None:
                 self.queue.task_done()
                 break
-            url = self._normalize(url)
-            with self.visited_lock:
-                if url in self.visited:
-                    self.queue.task_done()
-                    continue
-                self.visited.add(url)
+            local_out = self._url_to_path(url)
+            # pages are always refetched for their links; assets already on disk are revalidated
+            etag    = self._etags.get(url)
+            headers = None
+            if etag and not local_out.endswith(".html") and os.path.exists(local_out):
+                headers = {"If-None-Match": etag}
             try:
-                resp = self.session.get(url, timeout=12, stream=False)
-                time.sleep(self.delay)
+                self._limiter.acquire(url)
+                resp = self.session.get(url, timeout=12, stream=True, headers=headers)
             except Exception as e:
                 self.log(f"  ⚠ Fetch error: {url}  ({e})")
                 self.queue.task_done()
                 continue
-            if resp.status_code != 200:
+            unchanged = headers is not None and resp.status_code == 304
+            if resp.status_code != 200 and not unchanged:
                 self.log(f"  ⚠ HTTP {resp.status_code}: {url}")
+                resp.close()
                 self.queue.task_done()
                 continue
             ctype     = resp.headers.get("Content-Type", "")
-            local_out = self._url_to_path(url)
-            if "text/html" in ctype:
+            if unchanged:
+                pass  # the copy on disk stands
+            elif "text/html" in ctype:
                 try:
-                    soup = BeautifulSoup(resp.text, "html.parser")
+                    soup = make_soup(resp.content)
+                    current_dir = os.path.dirname(local_out)
                     for tag in soup.find_all(["a", "link", "script", "img",
                                               "video", "audio", "source"]):
                         attr = "href" if tag.name in ("a", "link") else "src"
                         link = tag.get(attr)
-                        if not link or link.startswith(("mailto:", "tel:", "javascript:", "#", "data:")):
+                        if not link or (link[0] in "#mdjt" and link.startswith(_SKIP_SCHEMES)):
                             continue
                         absolute = self._normalize(urljoin(url, link))
-                        if urlparse(absolute).netloc != self.base_domain:
+                        if not absolute.startswith(self._base_prefix) and \
+                                urlparse(absolute).netloc != self.base_domain:
                             continue
-                        child_path = self._url_to_path(absolute)
                         try:
-                            rel = os.path.relpath(child_path,
-                                                  os.path.dirname(self._url_to_path(url)))
-                            tag[attr] = rel.replace("\\", "/")
+                            tag[attr] = self._rel_link(self._url_to_path(absolute), current_dir)
                         except ValueError:
                             pass
-                        self.queue.put(absolute)
+                        self._enqueue(absolute)
                     self._save(local_out, soup.encode())
                 except Exception as e:
                     self.log(f"  ⚠ HTML parse error: {e}")
                     self._save(local_out, resp.content)
             else:
-                self._save(local_out, resp.content)
+                if not self._save_stream(local_out, resp, buf):
+                    resp.close()
+                    self.queue.task_done()
+                    continue
+                if resp.headers.get("ETag"):
+                    self._record_etag(url, resp.headers["ETag"])
+            resp.close()
             with self._count_lock:
                 self._downloaded += 1
                 n = self._downloaded
@@ -1579,16 +2215,18 @@ class MirrorCrawler:
         self.log(f"🌐 Starting mirror of: {self.base_url}")
         self.log(f"📁 Output folder: {self.output_dir}")
         os.makedirs(self.output_dir, exist_ok=True)
-        self.queue.put(self.base_url)
+        self._enqueue(self._normalize(self.base_url))
         threads = []
         for _ in range(self.max_workers):
             t = threading.Thread(target=self._worker, daemon=True)
             t.start()
             threads.append(t)
-        while not self._stop.is_set():
-            if self.queue.empty() and self.queue.unfinished_tasks == 0:
+        # queue.join() returns the moment the crawl drains; the wait only wakes to check for stop
+        done = threading.Event()
+        threading.Thread(target=lambda: (self.queue.join(), done.set()), daemon=True).start()
+        while not done.wait(0.4):
+            if self._stop.is_set():
                 break
-            time.sleep(0.4)
         if self._stop.is_set():
             self.log("⏹  Stop requested — draining queue...")
             with self.queue.mutex:
@@ -1599,6 +2237,7 @@ class MirrorCrawler:
             self.queue.put(None)
         for t in threads:
             t.join(timeout=6)
+        self._close_etags()
         n = self._downloaded
         self.log(f"🏆 Mirror complete — {n} file(s) saved to: {self.output_dir}")
         return n
@@ -1609,13 +2248,16 @@ class MirrorCrawler:
 # ─────────────────────────────────────────────
 
 class RuneAnimator:
-    def __init__(self, canvas, width, height):
-        import random
+    def __init__(self, canvas, width, height, max_fps=RUNE_MAX_FPS):
         self.canvas   = canvas
         self.width    = width
         self.height   = height
         self.runes    = []
         self._running = True
+        self._paused  = False
+        self._after_id = None
+        self._frame   = 1.0 / max_fps
+        self._last_tick = 0.0
         for _ in range(28):
             x      = random.randint(0, width)
             y      = random.randint(0, height)
@@ -1627,7 +2269,6 @@ class RuneAnimator:
             self.runes.append({'item': item, 'dy': random.choice([-1,1]) * speed})
         self._animate()
     def resize(self, new_width, new_height):
-        import random
         self.width  = new_width
         self.height = new_height
         for rune in self.runes:
@@ -1636,7 +2277,14 @@ class RuneAnimator:
                 self.canvas.coords(rune['item'],
                     random.randint(0, new_width), coords[1])
     def _animate(self):
-        if not self._running: return
+        self._after_id = None
+        if not self._running or self._paused: return
+        now  = time.perf_counter()
+        wait = self._frame - (now - self._last_tick)
+        if wait > 0.002:  # woken early (e.g. resume right after a frame): don't exceed max_fps
+            self._after_id = self.canvas.after(int(wait * 1000) + 1, self._animate)
+            return
+        self._last_tick = now
         for rune in self.runes:
             self.canvas.move(rune['item'], 0, rune['dy'])
             coords = self.canvas.coords(rune['item'])
@@ -1644,7 +2292,20 @@ class RuneAnimator:
                 y = coords[1]
                 if y < -30 or y > self.height + 30:
                     rune['dy'] = -rune['dy']
-        self.canvas.after(55, self._animate)
+        # the frame's own cost comes out of the budget instead of stacking on top of it
+        delay = self._frame - (time.perf_counter() - now)
+        self._after_id = self.canvas.after(max(1, int(delay * 1000)), self._animate)
+    def pause(self):
+        # nothing to animate while the header can't be seen
+        self._paused = True
+        if self._after_id is not None:
+            self.canvas.after_cancel(self._after_id)
+            self._after_id = None
+    def resume(self):
+        if self._paused:
+            self._paused = False
+            if self._after_id is None:
+                self._animate()
     def stop(self):
         self._running = False
 
@@ -1657,12 +2318,14 @@ class RuneAnimator:
 #  category sidebar, client-side search, Egyptian/esoteric theme.
 # ═════════════════════════════════════════════
 
-mimetypes.add_type("image/webp", ".webp")
-mimetypes.add_type("image/x-icon", ".ico")
-mimetypes.add_type("audio/mpeg", ".mp3")
-
 SKIP_PAGES = {"search.php.html", "search_ai.php.html"}
 
+_RE_PHP_HTML_SUFFIX = re.compile(r"\.php\.html$", re.IGNORECASE)
+_RE_PHP_SUFFIX      = re.compile(r"\.php$", re.IGNORECASE)
+_RE_KEY_UNSAFE      = re.compile(r"[^a-zA-Z0-9/_\-]")
+_RE_TAG             = re.compile(r"<[^>]+>")
+_RE_SPACES          = re.compile(r"\s+")
+
 # ─────────────────────────────────────────────
 #  CATEGORIZATION RULES (sidebar grouping)
 #  Categories are extracted dynamically from index.html data-toz-section attributes
@@ -1676,7 +2339,7 @@ def _extract_categories_from_index(src_folder: Path) -> dict:
         return categories
     try:
         raw = index_path.read_text(encoding="utf-8", errors="replace")
-        soup = BeautifulSoup(raw, "html.parser")
+        soup = make_soup(raw)
         for article in soup.find_all("article", attrs={"data-toz-section": True}):
             section_key = article["data-toz-section"]
             title_el = article.find(class_="title-text")
@@ -1733,8 +2396,7 @@ def categorize(page: dict, src_folder: Path = None) -> str:
 
 
 def esc(s: str) -> str:
-    return (s.replace("&", "&amp;").replace("<", "&lt;")
-             .replace(">", "&gt;").replace('"', "&quot;"))
+    return s.translate(_HTML_ESCAPE)
 
 
 # ─────────────────────────────────────────────
@@ -1839,9 +2501,9 @@ class StaticSiteFusionEngine:
     def _path_to_key(self, abs_path: Path) -> str:
         rel = abs_path.resolve().relative_to(self.src.resolve())
         key = str(rel).replace("\\", "/")
-        key = re.sub(r"\.php\.html$", "", key, flags=re.IGNORECASE)
-        key = re.sub(r"\.php$", "", key, flags=re.IGNORECASE)
-        key = re.sub(r"[^a-zA-Z0-9/_\-]", "_", key)
+        key = _RE_PHP_HTML_SUFFIX.sub("", key)
+        key = _RE_PHP_SUFFIX.sub("", key)
+        key = _RE_KEY_UNSAFE.sub("_", key)
         return key
 
     def _rewrite_internal_page_links(self, soup, key_index: dict, page_dir: Path):
@@ -1901,7 +2563,7 @@ class StaticSiteFusionEngine:
             rel = p.relative_to(self.src)
             try:
                 raw = p.read_text(encoding="utf-8", errors="replace")
-                soup = BeautifulSoup(raw, "lxml")
+                soup = make_soup(raw)
             except Exception as e:
                 errors.append((str(rel), str(e)))
                 continue
@@ -1978,8 +2640,8 @@ class StaticSiteFusionEngine:
 
         search_index = []
         for p in pages:
-            plain = re.sub(r"<[^>]+>", " ", p["content_html"])
-            plain = re.sub(r"\s+", " ", plain).strip()
+            plain = _RE_TAG.sub(" ", p["content_html"])
+            plain = _RE_SPACES.sub(" ", plain).strip()
             search_index.append({"key": p["key"], "title": p["h1"] or p["title"], "snippet": plain[:220]})
 
         sections_html = []
@@ -3042,7 +3704,52 @@ class PdfUnifierEngine:
 #  MAIN GUI
 # ─────────────────────────────────────────────
 
+# (attribute, family, size, weight, slant); a None family means Tk's default
+_FONT_SPECS = (
+    ("font_title",  "Palatino Linotype", 26, "bold",   "roman"),
+    ("font_sub",    "Palatino Linotype", 14, "normal", "italic"),
+    ("font_label",  "Palatino Linotype", 14, "normal", "roman"),
+    ("font_btn",    "Palatino Linotype", 14, "bold",   "roman"),
+    ("font_log",    "Courier New",       12, "normal", "roman"),
+    ("font_tab",    "Palatino Linotype", 14, "bold",   "roman"),
+    ("font_spin",   "Courier New",       13, "normal", "roman"),
+    ("font_status", "Palatino Linotype", 13, "normal", "roman"),
+    ("font_phase",  "Palatino Linotype", 13, "normal", "italic"),
+    ("font_chk",    "Palatino Linotype", 13, "normal", "roman"),
+)
+_FONT_SPECS_FALLBACK = (
+    ("font_title",  None,      24, "bold",   "roman"),
+    ("font_sub",    None,      13, "normal", "italic"),
+    ("font_label",  None,      13, "normal", "roman"),
+    ("font_btn",    None,      13, "bold",   "roman"),
+    ("font_log",    "Courier", 12, "normal", "roman"),
+    ("font_tab",    None,      14, "bold",   "roman"),
+    ("font_spin",   "Courier", 12, "normal", "roman"),
+    ("font_status", None,      12, "normal", "roman"),
+    ("font_phase",  None,      12, "normal", "italic"),
+    ("font_chk",    None,      12, "normal", "roman"),
+)
+_FONT_CACHE = {}
+def _cached_font(interp, family, size, weight, slant):
+    # Tk font allocation is a round-trip into the interpreter; build each font once per interpreter
+    key = (interp, family, size, weight, slant)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        kw = {"size": size, "weight": weight, "slant": slant}
+        if family:
+            kw["family"] = family
+        font = _FONT_CACHE[key] = tkfont.Font(root=interp, **kw)
+    return font
+# Restoration log colouring keyed on each line's leading marker (bare, 2- or 4-space indented)
+_RE_LOG_TAGS = {
+    "✅": "ok",   "  ✅": "ok",
+    "⚠": "warn",  "  ⚠": "warn",
+    "    ✦": "media", "    📥": "media",
+    **{c: "head" for c in ("ᛟ", "ᛊ", "ᚠ", "ᚱ", "ᚨ", "✨", "🜂")},
+}
+
 class ArcaneForumArchiver(tk.Tk):
+    _styled_interps = set()
     def __init__(self):
         super().__init__()
         self.title("✦ Arcane Forum Archiver ✦")
@@ -3057,37 +3764,44 @@ class ArcaneForumArchiver(tk.Tk):
         self._pu_stop          = threading.Event()
         self._rune_initialized = False
         self._title_ids        = []
+        self._resize_after_id  = None
+        self._pending_hdr_w    = 0
+        self._progress_pending = {}
+        self._progress_lock    = threading.Lock()
+        self._var_pending      = {}
+        self._var_lock         = threading.Lock()
+        self._job_queue        = Queue()
+        self._job_lock         = threading.Lock()
+        self._idle_workers     = 0
+        self._log_q            = deque()
+        self._log_lock         = threading.Lock()
+        self._log_pending      = False
         self._setup_fonts()
+        self._configure_styles()
         self._build_ui()
         self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.bind("<Unmap>", self._on_window_map, add="+")
+        self.bind("<Map>", self._on_window_map, add="+")
+        self.header_canvas.bind("<Visibility>", self._on_header_visibility)
     def _setup_fonts(self):
         try:
-            fam = "Palatino Linotype"
-            self.font_title  = tkfont.Font(family=fam, size=26, weight="bold")
-            self.font_sub    = tkfont.Font(family=fam, size=14, slant="italic")
-            self.font_label  = tkfont.Font(family=fam, size=14)
-            self.font_btn    = tkfont.Font(family=fam, size=14, weight="bold")
-            self.font_log    = tkfont.Font(family="Courier New", size=12)
-            self.font_tab    = tkfont.Font(family=fam, size=14, weight="bold")
-            self.font_spin   = tkfont.Font(family="Courier New", size=13)
-            self.font_status = tkfont.Font(family=fam, size=13)
-            self.font_phase  = tkfont.Font(family=fam, size=13, slant="italic")
-            self.font_chk    = tkfont.Font(family=fam, size=13)
+            for attr, *spec in _FONT_SPECS:
+                setattr(self, attr, _cached_font(self.tk, *spec))
         except:
-            self.font_title  = tkfont.Font(size=24, weight="bold")
-            self.font_sub    = tkfont.Font(size=13, slant="italic")
-            self.font_label  = tkfont.Font(size=13)
-            self.font_btn    = tkfont.Font(size=13, weight="bold")
-            self.font_log    = tkfont.Font(family="Courier", size=12)
-            self.font_tab    = tkfont.Font(size=14, weight="bold")
-            self.font_spin   = tkfont.Font(family="Courier", size=12)
-            self.font_status = tkfont.Font(size=12)
-            self.font_phase  = tkfont.Font(size=12, slant="italic")
-            self.font_chk    = tkfont.Font(size=12)
-    def _build_ui(self):
-        self.header_canvas = tk.Canvas(self, height=140, bg=BG_DEEP, highlightthickness=0)
-        self.header_canvas.pack(fill="x")
-        self.header_canvas.bind("<Configure>", self._on_header_resize)
+            for attr, *spec in _FONT_SPECS_FALLBACK:
+                setattr(self, attr, _cached_font(self.tk, *spec))
+        # shared widget options, built once for the dozens of helper calls below
+        self._label_opts = dict(bg=BG_MID, fg=TEXT_MAIN, font=self.font_label)
+        self._entry_opts = dict(bg=BG_PANEL, fg=ACCENT_TEAL, insertbackground=ACCENT_GOLD,
+                                relief="flat", bd=8, font=self.font_log)
+        self._btn_opts   = dict(fg=TEXT_MAIN, activebackground=ACCENT_GOLD, activeforeground=BG_DEEP,
+                                font=self.font_btn, relief="flat", bd=0,
+                                padx=22, pady=12, cursor="hand2")
+    def _configure_styles(self):
+        # ttk styles live in the interpreter, so set them up once rather than per widget
+        if self.tk in ArcaneForumArchiver._styled_interps:
+            return
+        ArcaneForumArchiver._styled_interps.add(self.tk)
         style = ttk.Style(self)
         style.theme_use("clam")
         style.configure("Arcane.TNotebook",
@@ -3098,6 +3812,27 @@ class ArcaneForumArchiver(tk.Tk):
         style.map("Arcane.TNotebook.Tab",
             background=[("selected", ACCENT_PURP)],
             foreground=[("selected", ACCENT_GOLD)])
+        style.configure("Arcane.Horizontal.TProgressbar",
+            troughcolor=BG_PANEL, background=ACCENT_PURP, borderwidth=0, thickness=22)
+        style.configure("Restore.Horizontal.TProgressbar",
+            troughcolor=BG_PANEL, background=ACCENT_GOLD, borderwidth=0, thickness=22)
+        style.configure("Mirror.Horizontal.TProgressbar",
+            troughcolor=BG_PANEL, background=ACCENT_TEAL, borderwidth=0, thickness=22)
+    def _build_ui(self):
+        self.header_canvas = tk.Canvas(self, height=140, bg=BG_DEEP, highlightthickness=0)
+        self.header_canvas.pack(fill="x")
+        self.header_canvas.bind("<Configure>", self._on_header_resize)
+        # created once; resizes only move them
+        self._title_ids = [
+            self.header_canvas.create_text(
+                0, 48, text="✦   ARCANE FORUM ARCHIVER   ✦",
+                fill=ACCENT_GOLD, font=self.font_title, anchor="center", tags="title"),
+            self.header_canvas.create_text(
+                0, 92, text="vBulletin Backup & Conversion  —  The Mystical Art of Data Preservation",
+                fill=TEXT_DIM, font=self.font_sub, anchor="center", tags="title"),
+            self.header_canvas.create_line(
+                30, 120, 30, 120, fill=BORDER_GLOW, width=1, tags="title"),
+        ]
         self.notebook = ttk.Notebook(self, style="Arcane.TNotebook")
         self.notebook.pack(fill="both", expand=True, padx=14, pady=10)
         self.tab_backup  = tk.Frame(self.notebook, bg=BG_MID)
@@ -3114,36 +3849,58 @@ class ArcaneForumArchiver(tk.Tk):
         self.notebook.add(self.tab_mirror,  text="  ᚹ  Website Mirror  ")
         self.notebook.add(self.tab_fusion,  text="  ᛞ  Static Site Fusion  ")
         self.notebook.add(self.tab_pdf,     text="  ᛗ  PDF Unifier  ")
+        # only the opening tab is built now; the rest on first visit
         self._build_tab_backup()
-        self._build_tab_convert()
-        self._build_tab_fullop()
-        self._build_tab_restore()
-        self._build_tab_mirror()
-        self._build_tab_fusion()
-        self._build_tab_pdf()
+        self._tab_builders = {
+            str(self.tab_convert): self._build_tab_convert,
+            str(self.tab_fullop):  self._build_tab_fullop,
+            str(self.tab_restore): self._build_tab_restore,
+            str(self.tab_mirror):  self._build_tab_mirror,
+            str(self.tab_fusion):  self._build_tab_fusion,
+            str(self.tab_pdf):     self._build_tab_pdf,
+        }
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         self.status_var = tk.StringVar(value="✦   Ready for the ritual   ✦")
         tk.Label(self, textvariable=self.status_var,
             bg=BG_PANEL, fg=ACCENT_TEAL, font=self.font_status,
             anchor="w", padx=18, pady=8, bd=0, relief="flat"
         ).pack(fill="x", side="bottom")
     def _on_header_resize(self, event):
-        w = event.width; cx = w // 2
-        for tid in self._title_ids:
-            self.header_canvas.delete(tid)
-        self._title_ids = []
-        self._title_ids.append(self.header_canvas.create_text(
-            cx, 48, text="✦   ARCANE FORUM ARCHIVER   ✦",
-            fill=ACCENT_GOLD, font=self.font_title, anchor="center"))
-        self._title_ids.append(self.header_canvas.create_text(
-            cx, 92, text="vBulletin Backup & Conversion  —  The Mystical Art of Data Preservation",
-            fill=TEXT_DIM, font=self.font_sub, anchor="center"))
-        self._title_ids.append(self.header_canvas.create_line(
-            30, 120, w-30, 120, fill=BORDER_GLOW, width=1))
+        self._pending_hdr_w = event.width
+        if self._resize_after_id is None:
+            self._resize_after_id = self.after(RESIZE_DEBOUNCE_MS, self._do_header_resize)
+    def _do_header_resize(self):
+        self._resize_after_id = None
+        w = self._pending_hdr_w; cx = w // 2
+        title, sub, line = self._title_ids
+        self.header_canvas.coords(title, cx, 48)
+        self.header_canvas.coords(sub, cx, 92)
+        self.header_canvas.coords(line, 30, 120, w-30, 120)
         if not self._rune_initialized and w > 100:
             self._rune_initialized = True
             self.rune_animator = RuneAnimator(self.header_canvas, w, 140)
+            self.header_canvas.tag_raise("title")
         elif self._rune_initialized:
             self.rune_animator.resize(w, 140)
+    def _on_tab_changed(self, event=None):
+        builder = self._tab_builders.pop(self.notebook.select(), None)
+        if builder:
+            builder()
+    def _on_window_map(self, event):
+        # the root's bindings fire for every child too; only the toplevel itself matters
+        if event.widget is not self or not self._rune_initialized:
+            return
+        if event.type == tk.EventType.Unmap:
+            self.rune_animator.pause()
+        else:
+            self.rune_animator.resume()
+    def _on_header_visibility(self, event):
+        if not self._rune_initialized:
+            return
+        if event.state == "VisibilityFullyObscured":
+            self.rune_animator.pause()
+        else:
+            self.rune_animator.resume()
     def _section(self, parent, title):
         lf = tk.LabelFrame(parent, text=f"   {title}   ",
             bg=BG_MID, fg=ACCENT_GOLD, font=self.font_sub,
@@ -3152,33 +3909,24 @@ class ArcaneForumArchiver(tk.Tk):
         lf.pack(fill="x", padx=20, pady=10)
         return lf
     def _label(self, parent, text):
-        return tk.Label(parent, text=text, bg=BG_MID, fg=TEXT_MAIN, font=self.font_label)
+        return tk.Label(parent, text=text, **self._label_opts)
     def _entry(self, parent, textvariable=None, width=46):
-        return tk.Entry(parent, textvariable=textvariable, width=width,
-            bg=BG_PANEL, fg=ACCENT_TEAL, insertbackground=ACCENT_GOLD,
-            relief="flat", bd=8, font=self.font_log)
+        return tk.Entry(parent, textvariable=textvariable, width=width, **self._entry_opts)
     def _btn(self, parent, text, command, color=ACCENT_PURP):
-        return tk.Button(parent, text=text, command=command,
-            bg=color, fg=TEXT_MAIN,
-            activebackground=ACCENT_GOLD, activeforeground=BG_DEEP,
-            font=self.font_btn, relief="flat", bd=0,
-            padx=22, pady=12, cursor="hand2")
+        return tk.Button(parent, text=text, command=command, bg=color, **self._btn_opts)
     def _spinbox(self, parent, from_, to, textvariable, width=7, increment=1.0):
         return tk.Spinbox(parent, from_=from_, to=to, increment=increment,
             textvariable=textvariable, width=width,
             bg=BG_PANEL, fg=ACCENT_TEAL, buttonbackground=BORDER_GLOW,
             font=self.font_spin)
     def _checkbox(self, parent, text, variable, accent=ACCENT_TEAL):
-        frame = tk.Frame(parent, bg=BG_MID)
-        cb = tk.Checkbutton(frame, text=text, variable=variable,
+        return tk.Checkbutton(parent, text=text, variable=variable,
             bg=BG_MID, fg=TEXT_MAIN,
             activebackground=BG_MID, activeforeground=ACCENT_GOLD,
             selectcolor=BG_PANEL,
             font=self.font_chk,
             bd=0, relief="flat",
             cursor="hand2")
-        cb.pack(side="left")
-        return frame
     def _logbox(self, parent, height=9):
         frame = tk.Frame(parent, bg=BG_PANEL, bd=1, relief="groove")
         frame.pack(fill="both", expand=True, padx=20, pady=8)
@@ -3191,23 +3939,86 @@ class ArcaneForumArchiver(tk.Tk):
         sb.config(command=box.yview)
         return box
     def _progressbar(self, parent):
-        style = ttk.Style()
-        style.configure("Arcane.Horizontal.TProgressbar",
-            troughcolor=BG_PANEL, background=ACCENT_PURP, borderwidth=0, thickness=22)
         pb = ttk.Progressbar(parent, style="Arcane.Horizontal.TProgressbar",
             orient="horizontal", mode="determinate")
         pb.pack(fill="x", padx=20, pady=6)
         return pb
-    def _log_write(self, box, msg):
-        def _do():
+    def _log_write(self, box, msg, tag=()):
+        # workers only queue lines; one ~60 Hz flush does the Tk work for the whole batch
+        with self._log_lock:
+            self._log_q.append((box, msg, tag))
+            if self._log_pending:
+                return
+            self._log_pending = True
+        self.after(LOG_FLUSH_MS, self._flush_logs)
+    def _flush_logs(self):
+        with self._log_lock:
+            q = self._log_q
+            batch = [q.popleft() for _ in range(min(len(q), LOG_FLUSH_MAX))]
+            self._log_pending = bool(q)
+        if self._log_pending:
+            self.after(LOG_FLUSH_MS, self._flush_logs)
+        runs = {}
+        for box, msg, tag in batch:
+            seq = runs.setdefault(box, [])
+            if seq and seq[-1][1] == tag:
+                seq[-1][0].append(msg)
+            else:
+                seq.append(([msg], tag))
+        for box, seq in runs.items():
+            args = []
+            for msgs, tag in seq:
+                args += ("\n".join(msgs) + "\n", tag)
             box.config(state="normal")
-            box.insert("end", msg + "\n")
+            box.insert("end", *args)
             box.see("end")
             box.config(state="disabled")
-        self.after(0, _do)
 
+    def _submit_job(self, job):
+        # long-lived daemon workers are reused across clicks; a new one starts only when all are busy
+        with self._job_lock:
+            spawn = self._idle_workers == 0
+            if not spawn:
+                self._idle_workers -= 1
+            self._job_queue.put(job)
+        if spawn:
+            threading.Thread(target=self._job_worker, daemon=True).start()
+    def _job_worker(self):
+        while True:
+            job = self._job_queue.get()
+            try:
+                job()
+            except Exception:
+                traceback.print_exc()
+            with self._job_lock:
+                self._idle_workers += 1
+    def _set_progress(self, bar, pct):
+        # only the latest value per bar survives; one timer applies it
+        with self._progress_lock:
+            scheduled = bar in self._progress_pending
+            self._progress_pending[bar] = pct
+        if not scheduled:
+            self.after(PROGRESS_FLUSH_MS, self._apply_progress, bar)
+    def _report_progress(self, bar, base, span, done, total):
+        # worker-side progress_callback: maps done/total onto [base, base+span] of the bar
+        self._set_progress(bar, base + done / total * span if total else base)
+    def _apply_progress(self, bar):
+        with self._progress_lock:
+            pct = self._progress_pending.pop(bar)
+        bar.configure(value=pct)
+    def _set_var(self, var, value):
+        # single slot per variable: bursts of updates collapse into one set once Tk is idle
+        with self._var_lock:
+            scheduled = str(var) in self._var_pending
+            self._var_pending[str(var)] = (var, value)
+        if not scheduled:
+            self.after_idle(self._flush_var, str(var))
+    def _flush_var(self, name):
+        with self._var_lock:
+            var, value = self._var_pending.pop(name)
+        var.set(value)
     def _set_status(self, msg):
-        self.after(0, lambda: self.status_var.set(msg))
+        self._set_var(self.status_var, msg)
     def _build_tab_backup(self):
         p = self.tab_backup
         sec = self._section(p, "🔮  Backup Configuration")
@@ -3234,6 +4045,9 @@ class ArcaneForumArchiver(tk.Tk):
         opt_frame.grid(row=3, column=0, columnspan=3, sticky="ew", padx=14, pady=8)
         self.bu_media = tk.BooleanVar(value=False)
         self._checkbox(opt_frame, "  📥  Also download images, videos & all media files", self.bu_media).pack(side="left")
+        # saved pages normally reuse their .media.txt list; this forces a fresh scan of the HTML
+        self.bu_rescan = tk.BooleanVar(value=False)
+        self._checkbox(opt_frame, "  🔁  Rescan saved pages for media", self.bu_rescan).pack(side="left", padx=(24,0))
         bf = tk.Frame(p, bg=BG_MID)
         bf.pack(pady=12)
         self._btn(bf, "⚡   START BACKUP", self._start_backup, ACCENT_PURP).pack(side="left", padx=12)
@@ -3254,6 +4068,8 @@ class ArcaneForumArchiver(tk.Tk):
         self._log_write(self.bu_log, "✨ Backup ritual initiated...")
         if self.bu_media.get():
             self._log_write(self.bu_log, "📥 Media download: ENABLED")
+            if self.bu_rescan.get():
+                self._log_write(self.bu_log, "🔁 Media rescan of saved pages: ENABLED")
         self._set_status("🔮   Backup in progress...")
         def run():
             backup = VBulletinBackup(
@@ -3265,15 +4081,14 @@ class ArcaneForumArchiver(tk.Tk):
                 log_callback=lambda m: self._log_write(self.bu_log, m),
                 download_media=self.bu_media.get(),
                 stop_event=self._stop_event,
+                rescan_media=self.bu_rescan.get(),
             )
             self._backup_obj = backup
-            def on_progress(done, total):
-                pct = (done/total*100) if total else 0
-                self.after(0, lambda: self.bu_progress.configure(value=pct))
-            result = backup.run_backup(progress_callback=on_progress)
+            result = backup.run_backup(
+                progress_callback=functools.partial(self._report_progress, self.bu_progress, 0, 100))
             self._set_status(f"✅   Backup complete — {result} threads downloaded")
-            self.after(0, lambda: self.bu_progress.configure(value=100))
-        threading.Thread(target=run, daemon=True).start()
+            self._set_progress(self.bu_progress, 100)
+        self._submit_job(run)
     def _build_tab_convert(self):
         p = self.tab_convert
         sec = self._section(p, "📜  HTML Grimoire Settings")
@@ -3324,21 +4139,18 @@ class ArcaneForumArchiver(tk.Tk):
             media_dl = MediaDownloader(indir,
                 log_callback=lambda m: self._log_write(self.co_log, m),
                 stop_event=self._stop_event) if self.co_embed.get() else None
-            def on_progress(done, total):
-                pct = (done/total*100) if total else 0
-                self.after(0, lambda: self.co_progress.configure(value=pct))
             result = convert_html_folder(
                 input_dir=indir,
                 output_file=outfile,
                 log_callback=lambda m: self._log_write(self.co_log, m),
-                progress_callback=on_progress,
+                progress_callback=functools.partial(self._report_progress, self.co_progress, 0, 100),
                 stop_event=self._stop_event,
                 media_dl=media_dl,
                 embed_base64=self.co_embed.get(),
             )
             self._set_status(f"✅   Grimoire sealed — {result} threads archived")
-            self.after(0, lambda: self.co_progress.configure(value=100))
-        threading.Thread(target=run, daemon=True).start()
+            self._set_progress(self.co_progress, 100)
+        self._submit_job(run)
     def _build_tab_fullop(self):
         p = self.tab_fullop
         sec = self._section(p, "⚡  Automatic Backup + Conversion")
@@ -3371,6 +4183,8 @@ class ArcaneForumArchiver(tk.Tk):
         self.fu_embed  = tk.BooleanVar(value=False)
         self._checkbox(opt_frame, "  📥  Download media files", self.fu_media).pack(side="left", padx=(0,24))
         self._checkbox(opt_frame, "  🖼  Embed media as Base64 in HTML", self.fu_embed).pack(side="left")
+        self.fu_rescan = tk.BooleanVar(value=False)
+        self._checkbox(opt_frame, "  🔁  Rescan saved pages", self.fu_rescan).pack(side="left", padx=(24,0))
         bf = tk.Frame(p, bg=BG_MID)
         bf.pack(pady=10)
         self._btn(bf, "⚡   BACKUP + CONVERT", self._start_fullop, "#4a1f7a").pack(side="left", padx=12)
@@ -3404,7 +4218,7 @@ class ArcaneForumArchiver(tk.Tk):
         embed_b64 = self.fu_embed.get()
         dl_media  = self.fu_media.get() or embed_b64
         def run():
-            self.after(0, lambda: self.fu_phase_var.set("🔮  Phase 1/2 — Downloading Forum..."))
+            self._set_var(self.fu_phase_var, "🔮  Phase 1/2 — Downloading Forum...")
             self._set_status("🔮   Phase 1/2: Backup in progress...")
             backup = VBulletinBackup(
                 base_url=url,
@@ -3415,49 +4229,54 @@ class ArcaneForumArchiver(tk.Tk):
                 log_callback=lambda m: self._log_write(self.fu_log, m),
                 download_media=dl_media,
                 stop_event=self._stop_event,
+                rescan_media=self.fu_rescan.get(),
             )
             self._backup_obj = backup
-            def on_progress_bu(done, total):
-                pct = (done/total*50) if total else 0
-                self.after(0, lambda: self.fu_progress.configure(value=pct))
-            backup_count = backup.run_backup(progress_callback=on_progress_bu)
+            backup_count = backup.run_backup(
+                progress_callback=functools.partial(self._report_progress, self.fu_progress, 0, 50))
             if self._stop_event.is_set():
                 self._set_status("⏹  Operation stopped."); return
-            self.after(0, lambda: self.fu_phase_var.set("📜  Phase 2/2 — Weaving HTML Grimoire..."))
+            self._set_var(self.fu_phase_var, "📜  Phase 2/2 — Weaving HTML Grimoire...")
             self._set_status("📜   Phase 2/2: Conversion in progress...")
             media_dl = MediaDownloader(outdir,
                 log_callback=lambda m: self._log_write(self.fu_log, m),
                 stop_event=self._stop_event) if embed_b64 else None
-            def on_progress_co(done, total):
-                pct = 50 + (done/total*50) if total else 50
-                self.after(0, lambda: self.fu_progress.configure(value=pct))
             convert_count = convert_html_folder(
                 input_dir=outdir,
                 output_file=outfile,
                 log_callback=lambda m: self._log_write(self.fu_log, m),
-                progress_callback=on_progress_co,
+                progress_callback=functools.partial(self._report_progress, self.fu_progress, 50, 50),
                 stop_event=self._stop_event,
                 media_dl=media_dl,
                 embed_base64=embed_b64,
                 forum_url=url,
             )
-            self.after(0, lambda: self.fu_phase_var.set("✅  Ritual complete — The grimoire is sealed!"))
+            self._set_var(self.fu_phase_var, "✅  Ritual complete — The grimoire is sealed!")
             self._set_status(f"✅   Done — {backup_count} threads downloaded, {convert_count} archived")
-            self.after(0, lambda: self.fu_progress.configure(value=100))
-        threading.Thread(target=run, daemon=True).start()
+            self._set_progress(self.fu_progress, 100)
+        self._submit_job(run)
     def _build_tab_restore(self):
         p = self.tab_restore
         banner = tk.Canvas(p, height=58, bg=BG_DEEP, highlightthickness=0)
         banner.pack(fill="x")
-        def _draw_banner(event):
-            banner.delete("all")
-            w = event.width
-            banner.create_text(w//2, 18,
+        banner_ids = (
+            banner.create_text(0, 18,
                 text="ᚠ ᚢ ᚦ ᚨ ᚱ ᚲ ᚷ ᚹ ᚺ ᚾ ᛁ ᛃ ᛇ ᛈ ᛉ ᛊ ᛏ ᛒ ᛖ ᛗ ᛚ ᛜ ᛞ ᛟ",
-                fill=BORDER_GLOW, font=self.font_log, anchor="center")
-            banner.create_text(w//2, 40,
+                fill=BORDER_GLOW, font=self.font_log, anchor="center"),
+            banner.create_text(0, 40,
                 text="✦   RESTORATION RITUAL  —  Reverse Parsing & Data Recovery   ✦",
-                fill=ACCENT_GOLD, font=self.font_sub, anchor="center")
+                fill=ACCENT_GOLD, font=self.font_sub, anchor="center"),
+        )
+        pending = {"w": 0, "id": None}
+        def _place_banner():
+            pending["id"] = None
+            cx = pending["w"] // 2
+            banner.coords(banner_ids[0], cx, 18)
+            banner.coords(banner_ids[1], cx, 40)
+        def _draw_banner(event):
+            pending["w"] = event.width
+            if pending["id"] is None:
+                pending["id"] = banner.after(RESIZE_DEBOUNCE_MS, _place_banner)
         banner.bind("<Configure>", _draw_banner)
         sec = tk.LabelFrame(p, text="   ᚨ  Input — Converted HTML Archive File   ",
             bg=BG_DEEP, fg=ACCENT_GOLD, font=self.font_sub,
@@ -3488,9 +4307,6 @@ class ArcaneForumArchiver(tk.Tk):
         tk.Label(p, textvariable=self.re_phase_var,
             bg=BG_DEEP, fg=ACCENT_GOLD, font=self.font_phase, anchor="w"
             ).pack(anchor="w", padx=22, pady=(4,0))
-        re_style = ttk.Style()
-        re_style.configure("Restore.Horizontal.TProgressbar",
-            troughcolor=BG_PANEL, background=ACCENT_GOLD, borderwidth=0, thickness=22)
         self.re_progress = ttk.Progressbar(p, style="Restore.Horizontal.TProgressbar",
             orient="horizontal", mode="determinate")
         self.re_progress.pack(fill="x", padx=20, pady=6)
@@ -3555,24 +4371,9 @@ class ArcaneForumArchiver(tk.Tk):
         if f:
             self.re_infile.set(f)
     def _re_log_write(self, msg):
-        def _do():
-            self.re_log.config(state="normal")
-            if msg.startswith("  ✅") or msg.startswith("✅"):
-                tag = "ok"
-            elif msg.startswith("  ⚠") or msg.startswith("⚠"):
-                tag = "warn"
-            elif msg.startswith("    ✦") or msg.startswith("    📥"):
-                tag = "media"
-            elif any(msg.startswith(pfx) for pfx in ["ᛟ","ᛊ","ᚠ","ᚱ","ᚨ","✨","🜂"]):
-                tag = "head"
-            elif "⏹" in msg:
-                tag = "warn"
-            else:
-                tag = "dim"
-            self.re_log.insert("end", msg + "\n", tag)
-            self.re_log.see("end")
-            self.re_log.config(state="disabled")
-        self.after(0, _do)
+        tag = (_RE_LOG_TAGS.get(msg[:1]) or _RE_LOG_TAGS.get(msg[:3]) or _RE_LOG_TAGS.get(msg[:5])
+               or ("warn" if "⏹" in msg else "dim"))
+        self._log_write(self.re_log, msg, tag)
     def _re_validate(self):
         path = self.re_infile.get().strip()
         if not path:
@@ -3583,32 +4384,36 @@ class ArcaneForumArchiver(tk.Tk):
             messagebox.showerror("Error",
                 "The selected path is not a valid file.")
             return None
-        if not path.lower().endswith((".html", ".htm")):
+        if not path[-5:].lower().endswith((".html", ".htm")):
             if not messagebox.askyesno("Warning",
                     "The file does not have an .html extension.\nProceed anyway?"):
                 return None
         return path
-    def _re_parse_phase(self, html_path):
+    def _re_parse_banner(self, html_path):
         self._re_cache = None
-        self.after(0, lambda: self.re_phase_var.set("ᚱ  Deciphering the pergamenes..."))
+        self._set_var(self.re_phase_var, "ᚱ  Deciphering the pergamenes...")
         self._re_log_write("=" * 60)
         self._re_log_write(f"🜂  Scroll selected: {os.path.basename(html_path)}")
         self._re_log_write("ᛟ  Materialising data from the void...")
-        all_threads, csv_rows, total_posts, recovered_dir = _parse_single_html(
-            html_path, self._re_log_write, self._stop_event)
+    def _re_parse_ok(self, n_threads, n_posts):
         if self._stop_event.is_set():
-            self.after(0, lambda: self.re_phase_var.set("⏹  Ritual interrupted."))
+            self._set_var(self.re_phase_var, "⏹  Ritual interrupted.")
             self._set_status("⏹   Restoration stopped.")
             return False
-        if not all_threads:
+        if not n_threads:
             self._re_log_write("⚠  No threads could be extracted from this file.")
-            self.after(0, lambda: self.re_phase_var.set("⚠  No data found."))
+            self._set_var(self.re_phase_var, "⚠  No data found.")
+            return False
+        self._re_log_write(f"  ✦ Parsed {n_threads} thread(s), {n_posts} post(s) total")
+        return True
+    def _re_parse_phase(self, html_path):
+        self._re_parse_banner(html_path)
+        all_threads, total_posts, recovered_dir = restoration_parse(
+            html_path, self._re_log_write, self._stop_event)
+        if not self._re_parse_ok(len(all_threads), total_posts):
             return False
-        self._re_log_write(
-            f"  ✦ Parsed {len(all_threads)} thread(s), {total_posts} post(s) total")
         self._re_cache = {
             "all_threads":    all_threads,
-            "csv_rows":       csv_rows,
             "total_posts":    total_posts,
             "recovered_dir":  recovered_dir,
             "html_dir":       os.path.dirname(os.path.abspath(html_path)),
@@ -3624,25 +4429,25 @@ class ArcaneForumArchiver(tk.Tk):
         def run():
             ok = self._re_parse_phase(html_path)
             if not ok: return
-            self.after(0, lambda: self.re_progress.configure(value=60))
-            self.after(0, lambda: self.re_phase_var.set("ᛊ  Inscribing the JSON codex..."))
+            self._set_progress(self.re_progress, 60)
+            self._set_var(self.re_phase_var, "ᛊ  Inscribing the JSON codex...")
             cache    = self._re_cache
             out_path = os.path.join(cache["html_dir"], "vbulletin_recovery.json")
             result   = restoration_write_json(
                 cache["all_threads"], cache["total_posts"], out_path, self._re_log_write)
-            self.after(0, lambda: self.re_progress.configure(value=100))
+            self._set_progress(self.re_progress, 100)
             if result:
                 n = len(cache["all_threads"]); p = cache["total_posts"]
                 summary = f"✅   JSON sealed — {n} thread(s), {p} post(s)  →  {os.path.basename(result)}"
-                self.after(0, lambda: self.re_phase_var.set("✅  JSON codex sealed — Data ready for the database."))
-                self.after(0, lambda: self.re_result_var.set(summary))
+                self._set_var(self.re_phase_var, "✅  JSON codex sealed — Data ready for the database.")
+                self._set_var(self.re_result_var, summary)
                 self._set_status(f"✅   JSON complete — {n} threads, {p} posts")
                 self._re_log_write(f"✅  Saved: {result}")
                 self._re_log_write("ᛟ  Ritual completed: Data ready for the database.")
             else:
-                self.after(0, lambda: self.re_phase_var.set("⚠  JSON write failed."))
+                self._set_var(self.re_phase_var, "⚠  JSON write failed.")
                 self._set_status("⚠   JSON write failed — check the log.")
-        threading.Thread(target=run, daemon=True).start()
+        self._submit_job(run)
     def _start_restore_csv(self):
         html_path = self._re_validate()
         if not html_path: return
@@ -3651,27 +4456,23 @@ class ArcaneForumArchiver(tk.Tk):
         self.re_result_var.set("")
         self._set_status("⊞   CSV conversion in progress...")
         def run():
-            ok = self._re_parse_phase(html_path)
-            if not ok: return
-            self.after(0, lambda: self.re_progress.configure(value=60))
-            self.after(0, lambda: self.re_phase_var.set("ᚠ  Etching the CSV tablet..."))
-            cache    = self._re_cache
-            out_path = os.path.join(cache["html_dir"], "vbulletin_recovery.csv")
-            result   = restoration_write_csv(
-                cache["csv_rows"], out_path, self._re_log_write)
-            self.after(0, lambda: self.re_progress.configure(value=100))
+            # one pass in the worker: rows are etched as threads are parsed, no thread tree comes back
+            self._re_parse_banner(html_path)
+            out_path = os.path.join(os.path.dirname(os.path.abspath(html_path)), "vbulletin_recovery.csv")
+            result, n, p = restoration_csv(html_path, out_path, self._re_log_write, self._stop_event)
+            if not self._re_parse_ok(n, p): return
+            self._set_progress(self.re_progress, 100)
             if result:
-                n = len(cache["all_threads"]); p = cache["total_posts"]
                 summary = f"✅   CSV sealed — {n} thread(s), {p} post(s)  →  {os.path.basename(result)}"
-                self.after(0, lambda: self.re_phase_var.set("✅  CSV tablet chiselled — Data ready for the database."))
-                self.after(0, lambda: self.re_result_var.set(summary))
+                self._set_var(self.re_phase_var, "✅  CSV tablet chiselled — Data ready for the database.")
+                self._set_var(self.re_result_var, summary)
                 self._set_status(f"✅   CSV complete — {n} threads, {p} posts")
                 self._re_log_write(f"✅  Saved: {result}")
                 self._re_log_write("ᛟ  Ritual completed: Data ready for the database.")
             else:
-                self.after(0, lambda: self.re_phase_var.set("⚠  CSV write failed."))
+                self._set_var(self.re_phase_var, "⚠  CSV write failed.")
                 self._set_status("⚠   CSV write failed — check the log.")
-        threading.Thread(target=run, daemon=True).start()
+        self._submit_job(run)
     def _build_tab_mirror(self):
         p = self.tab_mirror
         sec = self._section(p, "🌐  Website Mirror Configuration")
@@ -3709,11 +4510,8 @@ class ArcaneForumArchiver(tk.Tk):
         tk.Label(p, textvariable=self.mi_count_var,
             bg=BG_MID, fg=ACCENT_GOLD, font=self.font_phase, anchor="w"
         ).pack(anchor="w", padx=22, pady=(0, 4))
-        mi_style = ttk.Style()
-        mi_style.configure("Mirror.Horizontal.TProgressbar",
-            troughcolor=BG_PANEL, background=ACCENT_TEAL, borderwidth=0, thickness=22)
         self.mi_progress = ttk.Progressbar(p, style="Mirror.Horizontal.TProgressbar",
-            orient="horizontal", mode="indeterminate")
+            orient="horizontal", mode="determinate", maximum=1000)
         self.mi_progress.pack(fill="x", padx=20, pady=6)
         self.mi_log = self._logbox(p, height=13)
     def _pick_mi_dir(self):
@@ -3724,10 +4522,6 @@ class ArcaneForumArchiver(tk.Tk):
         self._mi_stop.set()
         self._set_status("⏹   Mirror stop requested...")
         self._log_write(self.mi_log, "⏹  Mirror stop requested — finishing current downloads...")
-        try:
-            self.mi_progress.stop()
-        except Exception:
-            pass
     def _start_mirror(self):
         url    = self.mi_url.get().strip()
         outdir = self.mi_outdir.get().strip()
@@ -3744,11 +4538,12 @@ class ArcaneForumArchiver(tk.Tk):
         self._log_write(self.mi_log, f"📁 Output folder: {outdir}")
         self._log_write(self.mi_log, f"⚙  Workers: {self.mi_workers.get()}  |  Delay: {self.mi_delay.get()}s")
         self.mi_count_var.set("🌐  Crawling…  (0 files downloaded)")
-        self.mi_progress.start(12)
+        self.mi_progress["value"] = 0
         self._set_status("🌐   Website Mirror in progress…")
         def on_progress(n):
-            self.after(0, lambda: self.mi_count_var.set(
-                f"🌐  Crawling…  {n} file(s) downloaded so far"))
+            # the crawl has no known total, so the bar fills on a log scale and only moves per file
+            self._set_progress(self.mi_progress, min(999, int(math.log2(n + 1) * 100)))
+            self._set_var(self.mi_count_var, f"🌐  Crawling…  {n} file(s) downloaded so far")
         def run():
             crawler = MirrorCrawler(
                 base_url=url,
@@ -3760,17 +4555,15 @@ class ArcaneForumArchiver(tk.Tk):
                 progress_callback=on_progress,
             )
             n = crawler.run()
-            def _finish():
-                self.mi_progress.stop()
-                self.mi_progress["value"] = 100
-                self.mi_count_var.set(f"✅  Mirror complete — {n} file(s) saved to: {outdir}")
-            self.after(0, _finish)
+            # same slots as the per-file updates, so a late one can't overwrite these
+            self._set_progress(self.mi_progress, 1000)
+            self._set_var(self.mi_count_var, f"✅  Mirror complete — {n} file(s) saved to: {outdir}")
             if self._mi_stop.is_set():
                 self._set_status(f"⏹   Mirror stopped — {n} files saved")
                 self._log_write(self.mi_log, f"⏹  Stopped. {n} file(s) saved.")
             else:
                 self._set_status(f"✅   Mirror complete — {n} files saved to: {outdir}")
-        threading.Thread(target=run, daemon=True).start()
+        self._submit_job(run)
     def _build_tab_fusion(self):
         p = self.tab_fusion
         sec = self._section(p, "🔥  Static Site Fusion Configuration")
@@ -3867,7 +4660,7 @@ class ArcaneForumArchiver(tk.Tk):
             else:
                 self.ss_phase_var.set("⚠  Fusion failed — check the log.")
                 self._set_status("⚠   Fusion failed — check the log.")
-        threading.Thread(target=run, daemon=True).start()
+        self._submit_job(run)
     def _build_tab_pdf(self):
         p = self.tab_pdf
         sec = self._section(p, "📚  PDF Unifier Configuration")
@@ -3964,20 +4757,23 @@ class ArcaneForumArchiver(tk.Tk):
             else:
                 self.pu_phase_var.set("⚠  Merge failed — check the log.")
                 self._set_status("⚠   PDF merge failed — check the log.")
-        threading.Thread(target=run, daemon=True).start()
+        self._submit_job(run)
     def _stop_operation(self):
         self._stop_event.set()
         self._fu_stop.set()
         self._pu_stop.set()
         self._set_status("⏹   Stop requested — finishing current task...")
-        for box in [self.bu_log, self.co_log, self.fu_log, self.ss_log, self.pu_log]:
-            self._log_write(box, "⏹  Operation stopped by user.")
+        for name in ("bu_log", "co_log", "fu_log", "ss_log", "pu_log"):
+            box = getattr(self, name, None)  # tabs never opened have no log yet
+            if box is not None:
+                self._log_write(box, "⏹  Operation stopped by user.")
         try:
             self._re_log_write("⏹  Ritual interrupted by user.")
         except Exception:
             pass
     def _on_close(self):
         self._stop_event.set()
+        restoration_stop()
         try:
             if self._rune_initialized:
                 self.rune_animator.stop()